@@ -0,0 +1,97 @@
+"""Scholarship selection engine shared by the Streamlit app and batch tools"""
+from .allocation import allocate, allocate_quotas, apportion, split_quotas, university_quotas
+from .assignment import (
+    DEFAULT_SCHOLARSHIP_AMOUNTS,
+    adjust_assignments,
+    assign_scholarships,
+    current_semester
+)
+from .batch import load_jobs, run_batch
+from .checkpoint import Checkpoints
+from .eligibility import check_eligibility, filter_eligible
+from .incremental import apply_student_updates, rerank_students
+from .pipeline import (
+    DEFAULT_CONFIG,
+    STUDENT_FILE_TYPES,
+    load_config,
+    load_students,
+    run_pipeline,
+    write_outputs
+)
+from .quota import calculate_quotas, department_quotas, quota_amounts, quota_table
+from .ranking import compute_rankings
+from .report import (
+    REPORT_TYPES,
+    build_text_report,
+    detailed_analytics,
+    iter_text_report,
+    recipient_pivot,
+    summarize_recipients,
+    workbook_sheets,
+    write_text_report
+)
+from .sample import generate_sample_data
+from .scenarios import restrict_ranking, run_scenarios, scenario_grid
+from .schema import (
+    CATEGORY_COLUMNS,
+    INTEGER_COLUMNS,
+    REQUIRED_COLUMNS,
+    SchemaError,
+    memory_report,
+    normalize_students,
+    read_students_csv
+)
+from .store import SQLiteStore
+from .views import join_students, student_columns
+
+__all__ = [
+    'CATEGORY_COLUMNS',
+    'Checkpoints',
+    'DEFAULT_CONFIG',
+    'DEFAULT_SCHOLARSHIP_AMOUNTS',
+    'INTEGER_COLUMNS',
+    'REPORT_TYPES',
+    'REQUIRED_COLUMNS',
+    'SQLiteStore',
+    'STUDENT_FILE_TYPES',
+    'SchemaError',
+    'adjust_assignments',
+    'allocate',
+    'allocate_quotas',
+    'apply_student_updates',
+    'apportion',
+    'assign_scholarships',
+    'build_text_report',
+    'calculate_quotas',
+    'check_eligibility',
+    'compute_rankings',
+    'current_semester',
+    'department_quotas',
+    'detailed_analytics',
+    'filter_eligible',
+    'generate_sample_data',
+    'iter_text_report',
+    'join_students',
+    'load_config',
+    'load_jobs',
+    'load_students',
+    'memory_report',
+    'normalize_students',
+    'quota_amounts',
+    'quota_table',
+    'read_students_csv',
+    'recipient_pivot',
+    'rerank_students',
+    'restrict_ranking',
+    'run_batch',
+    'run_pipeline',
+    'run_scenarios',
+    'scenario_grid',
+    'split_quotas',
+    'student_columns',
+    'summarize_recipients',
+    'university_quotas',
+    'workbook_sheets',
+    'write_outputs',
+    'write_text_report'
+]
@@ -0,0 +1,165 @@
+"""Hierarchical TO apportionment (university → college → department → grade)
+
+The university-wide TO per scholarship type is bought from the budget, then
+split level by level in proportion to enrollment with the largest-remainder
+method. Every level is one array pass over all units at once, and each
+unit's TO sums exactly to its parent's, so the spend never exceeds the
+budget.
+"""
+import numpy as np
+import pandas as pd
+
+# Amount paid per award of each type, in the order tiers are filled
+DEFAULT_SCHOLARSHIP_AMOUNTS = {
+    '율곡장학': 5000000,
+    '다산장학': 3000000,
+    '원천장학': 2000000
+}
+
+# Share of the remaining budget spent on each tier in turn (율곡 30%, 다산 30% of the rest, ...)
+TIER_BUDGET_SHARE = 0.3
+
+ROOT = '전체'
+
+
+def default_budget_shares(scholarship_types, tier_share=TIER_BUDGET_SHARE):
+    """Budget share per type: ``tier_share`` of whatever the higher tiers left over"""
+    return {
+        scholarship_type: tier_share * (1 - tier_share) ** i
+        for i, scholarship_type in enumerate(scholarship_types)
+    }
+
+
+def university_quotas(total_budget, scholarship_amounts=None, budget_shares=None):
+    """University-wide TO per scholarship type that the budget can pay for
+
+    Each type gets ``floor(budget * share / amount)`` slots, so the total spend
+    stays within the budget as long as the shares sum to at most 1.
+    """
+    if scholarship_amounts is None:
+        scholarship_amounts = DEFAULT_SCHOLARSHIP_AMOUNTS
+    if budget_shares is None:
+        budget_shares = default_budget_shares(scholarship_amounts)
+    if sum(budget_shares.get(t, 0) for t in scholarship_amounts) > 1 + 1e-9:
+        raise ValueError("Budget shares must not sum to more than 1")
+    
+    quotas = {}
+    for scholarship_type, amount in scholarship_amounts.items():
+        share = budget_shares.get(scholarship_type, 0)
+        quotas[scholarship_type] = int(total_budget * share // amount) if amount > 0 else 0
+    return pd.Series(quotas, dtype='int64')
+
+
+def apportion(weights, totals, parents):
+    """Largest-remainder split of each parent's totals among its children
+
+    ``weights`` (children,) are non-negative integers, ``totals`` is a
+    (parents, types) integer array and ``parents`` maps each child to its
+    parent row. Returns a (children, types) array whose rows sum, per
+    parent, exactly to ``totals``. Children of a parent with zero total
+    weight share its totals equally; remainder ties go to the earlier child.
+    """
+    weights = np.asarray(weights, dtype=np.int64)
+    totals = np.asarray(totals, dtype=np.int64)
+    parents = np.asarray(parents, dtype=np.int64)
+    n_parents = len(totals)
+    
+    parent_weight = np.bincount(parents, weights, minlength=n_parents).astype(np.int64)
+    weights = np.where(parent_weight[parents] > 0, weights, 1)
+    parent_weight = np.bincount(parents, weights, minlength=n_parents).astype(np.int64)
+    
+    # Exact integer shares: floor part and remainder over the common parent denominator
+    numerators = totals[parents] * weights[:, None]
+    seats, remainders = np.divmod(numerators, parent_weight[parents][:, None])
+    
+    position = np.arange(len(weights))
+    for col in range(totals.shape[1]):
+        leftover = totals[:, col] - np.bincount(parents, seats[:, col], minlength=n_parents).astype(np.int64)
+        order = np.lexsort((position, -remainders[:, col], parents))
+        group_start = np.searchsorted(parents[order], parents[order], side='left')
+        rank_in_parent = np.arange(len(order)) - group_start
+        seats[order, col] += rank_in_parent < leftover[parents[order]]
+    return seats
+
+
+def allocate(enrollment, totals):
+    """Apportion ``totals`` down the index levels of ``enrollment``
+
+    ``enrollment`` is a Series of head counts indexed by one or more levels
+    (e.g. college, department, grade); ``totals`` is a DataFrame of TO per
+    type indexed by values of the first level. Returns a DataFrame with
+    ``enrollment``'s index and one TO column per type.
+    """
+    enrollment = enrollment.sort_index()
+    index = enrollment.index
+    if not isinstance(index, pd.MultiIndex):
+        index = pd.MultiIndex.from_arrays([index])
+    n_units = len(enrollment)
+    if n_units == 0:
+        return pd.DataFrame(columns=totals.columns, index=enrollment.index, dtype='int64')
+    
+    weights = enrollment.to_numpy(dtype=np.int64)
+    level_codes = [pd.factorize(index.get_level_values(i))[0] for i in range(index.nlevels)]
+    
+    changed = level_codes[0][1:] != level_codes[0][:-1]
+    node = np.r_[0, np.cumsum(changed)]
+    starts = np.flatnonzero(np.r_[True, changed])
+    top = index.get_level_values(0)[starts]
+    node_totals = totals.reindex(top).fillna(0).to_numpy(dtype=np.int64)
+    
+    for depth in range(1, index.nlevels):
+        changed |= level_codes[depth][1:] != level_codes[depth][:-1]
+        child = np.r_[0, np.cumsum(changed)]
+        starts = np.flatnonzero(np.r_[True, changed])
+        child_weights = np.bincount(child, weights).astype(np.int64)
+        node_totals = apportion(child_weights, node_totals, node[starts])
+        node = child
+    
+    return pd.DataFrame(node_totals[node], index=enrollment.index, columns=totals.columns)
+
+
+def allocate_quotas(students, total_budget, scholarship_amounts=None, budget_shares=None,
+                    levels=('college', 'department', 'grade')):
+    """TO per scholarship type for every unit at the finest of ``levels``
+
+    Only enrolled (재학) students count towards enrollment. Returns one row
+    per unit with the level columns, '재학생수' and one TO column per type;
+    summing over any coarser level reproduces that level's allocation.
+    """
+    if scholarship_amounts is None:
+        scholarship_amounts = DEFAULT_SCHOLARSHIP_AMOUNTS
+    levels = list(levels)
+    
+    active = students[students['academic_status'] == '재학']
+    enrollment = active.groupby(levels, observed=True).size()
+    seats = university_quotas(total_budget, scholarship_amounts, budget_shares)
+    
+    rooted = pd.concat({ROOT: enrollment}, names=['_root'])
+    quotas = allocate(rooted, pd.DataFrame([seats], index=[ROOT])).droplevel(0)
+    
+    units = quotas.index.to_frame(index=False)
+    units['재학생수'] = enrollment.reindex(quotas.index).to_numpy()
+    return pd.concat([units, quotas.reset_index(drop=True)], axis=1)
+
+
+def split_quotas(students, quota_results, levels=('college', 'department', 'grade')):
+    """Split each college's TO in ``quota_results`` down to the units at ``levels``
+
+    ``quota_results`` is the output of ``quota.calculate_quotas``. The split
+    uses the same enrollment weights as ``allocate_quotas``, so for a TO
+    bought from a budget every unit gets exactly its ``allocate_quotas`` TO.
+    Returns a frame indexed by ``levels`` with one TO column per type.
+    """
+    active = students[students['academic_status'] == '재학']
+    active = active[active['college'].isin(list(quota_results))]
+    enrollment = active.groupby(list(levels), observed=True).size()
+    
+    types = []
+    for data in quota_results.values():
+        types.extend(t for t in data['quotas'] if t not in types)
+    college_totals = pd.DataFrame(
+        [[data['quotas'].get(t, 0) for t in types] for data in quota_results.values()],
+        index=list(quota_results),
+        columns=types
+    )
+    return allocate(enrollment, college_totals)
@@ -0,0 +1,125 @@
+"""Scholarship recipient assignment (FUR-006)"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .allocation import DEFAULT_SCHOLARSHIP_AMOUNTS, split_quotas
+from .quota import quota_amounts
+from .views import student_columns
+
+# Columns of an assignment result; student attributes are joined with ``views.join_students``
+ASSIGNMENT_COLUMNS = [
+    'row', 'rank', 'scholarship_type', 'scholarship_amount', 'assignment_date', 'assignment_semester'
+]
+
+
+def current_semester(date=None):
+    """Academic semester label for ``date`` (default today), e.g. "2024-1"
+
+    The first semester runs March to August and the second September to
+    February, so January and February belong to the previous year's second.
+    """
+    if date is None:
+        date = datetime.now()
+    if date.month >= 9:
+        return f"{date.year}-2"
+    if date.month >= 3:
+        return f"{date.year}-1"
+    return f"{date.year - 1}-2"
+
+
+def assign_scholarships(ranking_data, quota_data, students, scholarship_amounts=None,
+                        assignment_date=None, assignment_semester=None):
+    """Assign scholarship types to the top-ranked students of each dept-grade
+
+    Each (college, department, grade) group receives its share of the
+    college TO per scholarship type, as split by ``allocation.split_quotas``,
+    so no type is awarded more often than its TO and the spend stays within
+    the budget the TO was bought from. Students are walked in rank order and
+    take the first tier whose cumulative slot boundary they fall under.
+    Everything is computed with array comparisons instead of per-group
+    filtering. ``scholarship_amounts`` defaults to the amounts the TO was
+    priced at and ``assignment_semester`` to the semester of
+    ``assignment_date``.
+
+    ``ranking_data`` is the thin ranking from ``compute_rankings`` and
+    ``students`` the frame it was computed from. Returns a thin frame:
+    ``row``, ``rank`` and the scholarship columns.
+    """
+    if scholarship_amounts is None:
+        scholarship_amounts = quota_amounts(quota_data)
+    if assignment_date is None:
+        assignment_date = datetime.now().strftime('%Y-%m-%d')
+    if assignment_semester is None:
+        assignment_semester = current_semester(pd.Timestamp(assignment_date))
+    
+    keys = student_columns(ranking_data, students, ['college', 'department', 'grade'])
+    in_quota = keys['college'].isin(list(quota_data)).to_numpy()
+    ranking_data = ranking_data[in_quota]
+    keys = keys[in_quota]
+    if len(ranking_data) == 0:
+        return pd.DataFrame(columns=ASSIGNMENT_COLUMNS)
+    
+    # TO per dept-grade group, one column per scholarship tier in the order they are filled
+    group_quotas = split_quotas(students, quota_data)
+    scholarship_types = list(group_quotas.columns)
+    
+    # Colleges and departments are visited in order of first appearance, grades ascending
+    college_codes, _ = pd.factorize(keys['college'])
+    dept_codes = keys.groupby(['college', 'department'], sort=False, observed=True).ngroup().to_numpy()
+    grade_codes, _ = pd.factorize(keys['grade'], sort=True)
+    rank = ranking_data['rank'].to_numpy()
+    order = np.lexsort((rank, grade_codes, dept_codes, college_codes))
+    
+    sorted_dept = dept_codes[order]
+    sorted_grade = grade_codes[order]
+    new_group = np.empty(len(order), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = (sorted_dept[1:] != sorted_dept[:-1]) | (sorted_grade[1:] != sorted_grade[:-1])
+    group_starts = np.flatnonzero(new_group)
+    group_sizes = np.diff(np.append(group_starts, len(order)))
+    
+    # Slot table: one row per dept-grade group; groups without enrolled students get none
+    group_index = pd.MultiIndex.from_frame(keys.take(order[group_starts]))
+    slots = group_quotas.reindex(group_index, fill_value=0).to_numpy(dtype=np.int64)
+    slot_bounds = np.cumsum(slots, axis=1)
+    
+    position = np.arange(len(order)) - np.repeat(group_starts, group_sizes)
+    row_bounds = np.repeat(slot_bounds, group_sizes, axis=0)
+    assigned = position < row_bounds[:, -1]
+    tier = (position[:, None] >= row_bounds[:, :-1]).sum(axis=1)[assigned]
+    
+    type_values = np.array(scholarship_types, dtype=object)
+    amount_values = np.array([scholarship_amounts.get(t, 0) for t in scholarship_types], dtype=np.int64)
+    
+    assignments = ranking_data[['row', 'rank']].take(order[assigned]).reset_index(drop=True)
+    assignments['scholarship_type'] = type_values[tier]
+    assignments['scholarship_amount'] = amount_values[tier]
+    assignments['assignment_date'] = assignment_date
+    assignments['assignment_semester'] = assignment_semester
+    return assignments
+
+
+def adjust_assignments(assignments, overrides, scholarship_amounts=None):
+    """Apply manual changes to an assignment result without touching it
+
+    ``overrides`` has one row per changed recipient: ``row`` and the new
+    ``scholarship_type``, or None to withdraw the award. Amounts follow the
+    new type, as paid in ``assignments`` or else from ``scholarship_amounts``.
+    Returns a new frame; ``assignments`` itself may be shared and stays as is.
+    """
+    if overrides is None or overrides.empty:
+        return assignments
+    amounts = dict(scholarship_amounts or DEFAULT_SCHOLARSHIP_AMOUNTS)
+    amounts.update(zip(assignments['scholarship_type'], assignments['scholarship_amount']))
+    
+    new_types = pd.Series(
+        overrides['scholarship_type'].to_numpy(dtype=object), index=overrides['row'].to_numpy()
+    )
+    changed = assignments['row'].isin(new_types.index).to_numpy()
+    adjusted = assignments.copy()
+    types = new_types.reindex(adjusted.loc[changed, 'row']).to_numpy()
+    adjusted.loc[changed, 'scholarship_type'] = types
+    adjusted.loc[changed, 'scholarship_amount'] = [amounts.get(t, 0) for t in types]
+    return adjusted[adjusted['scholarship_type'].notna()].reset_index(drop=True)
@@ -0,0 +1,146 @@
+"""Parallel batch runs of the pipeline, one job per campus and semester
+
+A manifest lists the jobs, either as JSON::
+
+    [
+        {"campus": "서울", "semester": "2024-1", "input": "seoul_2024_1.csv"},
+        {"campus": "안산", "semester": "2024-2", "input": "ansan_2024_2.parquet",
+         "config": "ansan.json", "budget": 300000000}
+    ]
+
+or as a CSV with the same columns. Each job runs the whole ranking → TO →
+assignment pipeline in its own worker process and writes its outputs to
+``<output_dir>/<campus>/<semester>/``; ``batch_summary.csv`` and
+``batch_recipients.csv`` at the top of ``output_dir`` consolidate them.
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .pipeline import (
+    DEFAULT_CONFIG,
+    read_input,
+    run_pipeline,
+    write_outputs,
+    write_rejected_rows
+)
+from .schema import normalize_students
+
+JOB_FIELDS = ['campus', 'semester', 'input', 'config', 'budget']
+
+COUNT_COLUMNS = ['학생수', '제외행', '순위대상', 'TO', '선정인원', '집행예산', '총예산']
+
+
+def load_jobs(path):
+    """Read a JSON or CSV job manifest; relative paths are resolved against its directory"""
+    if str(path).lower().endswith('.csv'):
+        jobs = pd.read_csv(path, dtype=str, keep_default_na=False).to_dict('records')
+    else:
+        with open(path, encoding='utf-8') as f:
+            jobs = json.load(f)
+        if isinstance(jobs, dict):
+            jobs = jobs['jobs']
+    
+    base_dir = os.path.dirname(os.path.abspath(path))
+    normalized = []
+    for job in jobs:
+        job = {field: job.get(field) or None for field in JOB_FIELDS}
+        if not (job['campus'] and job['semester'] and job['input']):
+            raise ValueError(f"Job needs campus, semester and input: {job}")
+        job['input'] = os.path.join(base_dir, job['input'])
+        if isinstance(job['config'], str):
+            job['config'] = os.path.join(base_dir, job['config'])
+        if job['budget'] is not None:
+            job['budget'] = int(job['budget'])
+        normalized.append(job)
+    return normalized
+
+
+def _job_output_dir(output_dir, job):
+    return os.path.join(output_dir, str(job['campus']), str(job['semester']))
+
+
+def run_job(job, output_dir, base_config=None, file_format='csv', include_report=False, chunksize=100000):
+    """Run one job and return its summary row (failures are reported, not raised)"""
+    started = time.perf_counter()
+    row = {'캠퍼스': job['campus'], '학기': job['semester'], '입력파일': job['input']}
+    try:
+        # Precedence: base config < job config file/dict < job budget; the semester is the job's
+        config = dict(base_config or DEFAULT_CONFIG)
+        if isinstance(job['config'], dict):
+            config.update(job['config'])
+        elif job['config']:
+            with open(job['config'], encoding='utf-8') as f:
+                config.update(json.load(f))
+        if job['budget'] is not None:
+            config['total_budget'] = job['budget']
+        config['assignment_semester'] = job['semester']
+        
+        students, error_report, rejected_count = read_input(job['input'], chunksize)
+        results = run_pipeline(normalize_students(students), config)
+        
+        target = _job_output_dir(output_dir, job)
+        write_outputs(results, target, file_format, include_report=include_report)
+        if rejected_count:
+            write_rejected_rows(error_report, target)
+        
+        recipients = results['recipients']
+        row.update({
+            '학생수': len(students),
+            '제외행': rejected_count,
+            '순위대상': len(results['rankings']),
+            'TO': int(results['quota_table']['총TO'].sum()) if not results['quota_table'].empty else 0,
+            '선정인원': len(recipients),
+            '집행예산': int(recipients['scholarship_amount'].sum()) if not recipients.empty else 0,
+            '총예산': config['total_budget'],
+            '상태': '완료',
+            '오류': None,
+            '출력경로': target
+        })
+        summary = results['summary']
+    except Exception as exc:
+        row.update({'상태': '실패', '오류': f"{type(exc).__name__}: {exc}"})
+        summary = pd.DataFrame()
+    row['소요시간(초)'] = round(time.perf_counter() - started, 2)
+    return row, summary
+
+
+def run_batch(jobs, output_dir, base_config=None, file_format='csv', include_report=False,
+              chunksize=100000, max_workers=None):
+    """Run ``jobs`` in parallel, one per worker process, and write the consolidated summary
+
+    Returns the summary table (one row per job, in manifest order). The
+    per-job recipient summaries are stacked with campus and semester
+    columns into ``batch_recipients.csv``.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(jobs)))
+    
+    args = (output_dir, base_config, file_format, include_report, chunksize)
+    if max_workers == 1:
+        outcomes = [run_job(job, *args) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(run_job, job, *args) for job in jobs]
+            outcomes = [future.result() for future in futures]
+    
+    summary = pd.DataFrame([row for row, _ in outcomes])
+    # Failed jobs leave the counts empty; keep the rest as integers
+    count_columns = [col for col in COUNT_COLUMNS if col in summary.columns]
+    summary[count_columns] = summary[count_columns].astype('Int64')
+    summary.to_csv(os.path.join(output_dir, 'batch_summary.csv'), index=False, encoding='utf-8-sig')
+    
+    recipient_tables = [
+        table.assign(캠퍼스=row['캠퍼스'], 학기=row['학기'])
+        for row, table in outcomes if not table.empty
+    ]
+    if recipient_tables:
+        recipients = pd.concat(recipient_tables, ignore_index=True)
+        recipients = recipients[['캠퍼스', '학기'] + [c for c in recipients.columns if c not in ('캠퍼스', '학기')]]
+        recipients.to_csv(os.path.join(output_dir, 'batch_recipients.csv'), index=False, encoding='utf-8-sig')
+    return summary
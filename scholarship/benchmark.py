@@ -0,0 +1,200 @@
+"""Headless benchmark of the pipeline stages at growing enrollment sizes
+
+Example::
+
+    python -m scholarship.benchmark --sizes 1000 10000 100000 1000000 --output bench.json
+    python -m scholarship.benchmark --compare bench.json
+
+Every size uses ``generate_sample_data`` with a fixed seed, so runs are
+reproducible across versions. Each stage is timed ``--repeat`` times
+(the best time is kept) without tracing, then run once more under
+``tracemalloc`` for its peak memory (allocations made through Python and
+NumPy; Arrow buffers are only reflected in the process-wide max RSS). The budget grows with enrollment
+(``--budget-per-student``) so the assignment and report scale too.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from .assignment import assign_scholarships
+from .eligibility import filter_eligible
+from .export import csv_bytes
+from .quota import calculate_quotas, department_quotas
+from .ranking import compute_rankings
+from .report import write_text_report
+from .sample import generate_sample_data
+from .schema import normalize_students
+from .views import join_students
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+
+# Each stage reads what earlier stages stored in ``state`` and returns its own output
+STAGES = [
+    ('generate', lambda state: generate_sample_data(state['n_students'], seed=state['seed'])),
+    ('normalize', lambda state: normalize_students(state['generate'])),
+    ('eligibility', lambda state: filter_eligible(state['normalize'])),
+    ('ranking', lambda state: compute_rankings(state['eligibility'])),
+    ('quota', lambda state: calculate_quotas(state['normalize'], state['budget'])),
+    ('department_quota', lambda state: department_quotas(state['normalize'], state['quota'])),
+    ('assignment', lambda state: assign_scholarships(state['ranking'], state['quota'], state['normalize'])),
+    ('join', lambda state: join_students(state['ranking'], state['normalize'])),
+    ('report', lambda state: write_text_report(
+        join_students(state['assignment'], state['normalize']), state['report_path']
+    )),
+    ('csv_export', lambda state: csv_bytes(state['join'])),
+]
+
+
+def _rows(value):
+    """Output size of a stage: rows for frames, entries for dicts, bytes otherwise"""
+    if isinstance(value, (pd.DataFrame, dict, bytes)):
+        return len(value)
+    return int(value) if isinstance(value, (int, np.integer)) else None
+
+
+def run_benchmark(sizes=None, repeat=3, seed=42, budget_per_student=200000, measure_memory=True):
+    """Time every stage at every size and return one result row per (size, stage)"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_students in sizes or DEFAULT_SIZES:
+            state = {
+                'n_students': n_students,
+                'seed': seed,
+                'budget': n_students * budget_per_student,
+                'report_path': os.path.join(tmp, 'report.txt')
+            }
+            for stage, run in STAGES:
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    output = run(state)
+                    timings.append(time.perf_counter() - started)
+                
+                peak_bytes = None
+                if measure_memory:
+                    tracemalloc.start()
+                    run(state)
+                    peak_bytes = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                
+                state[stage] = output
+                results.append({
+                    'n_students': n_students,
+                    'stage': stage,
+                    'seconds': min(timings),
+                    'seconds_all': timings,
+                    'peak_bytes': peak_bytes,
+                    'output_size': _rows(output)
+                })
+    return results
+
+
+def environment():
+    """Interpreter, library and machine details stored alongside the timings"""
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def max_rss_bytes():
+    """Peak resident set size of this process, or None where it is not available"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+COMPARE_COLUMNS = ['n_students', 'stage', 'baseline_s', 'current_s', 'ratio', 'regression']
+
+
+def compare(current, baseline, tolerance=0.2):
+    """Per (size, stage) time ratios against a baseline run; ratios above 1 + tolerance are regressions
+
+    Only (size, stage) pairs present in both runs are compared; the frame is
+    empty (with the same columns) when they share none.
+    """
+    base = {(r['n_students'], r['stage']): r for r in baseline['results']}
+    rows = []
+    for r in current['results']:
+        b = base.get((r['n_students'], r['stage']))
+        if b is None:
+            continue
+        ratio = r['seconds'] / b['seconds'] if b['seconds'] > 0 else float('inf')
+        rows.append({
+            'n_students': r['n_students'],
+            'stage': r['stage'],
+            'baseline_s': b['seconds'],
+            'current_s': r['seconds'],
+            'ratio': ratio,
+            'regression': ratio > 1 + tolerance
+        })
+    return pd.DataFrame(rows, columns=COMPARE_COLUMNS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m scholarship.benchmark',
+        description="단계별 처리 시간과 최대 메모리 벤치마크"
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="학생 수 목록")
+    parser.add_argument('--repeat', type=int, default=3, help="단계별 반복 횟수 (최소 시간 기록)")
+    parser.add_argument('--seed', type=int, default=42, help="샘플 데이터 난수 시드")
+    parser.add_argument('--budget-per-student', type=int, default=200000, help="학생 1인당 예산 (원)")
+    parser.add_argument('--no-memory', action='store_true', help="tracemalloc 메모리 측정 생략")
+    parser.add_argument('--output', help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    parser.add_argument('--compare', metavar='BASELINE', help="기준 JSON과 비교해 느려진 단계를 표시")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="회귀로 판단할 시간 증가 비율")
+    args = parser.parse_args(argv)
+    
+    report = {
+        'environment': environment(),
+        'settings': {
+            'sizes': args.sizes,
+            'repeat': args.repeat,
+            'seed': args.seed,
+            'budget_per_student': args.budget_per_student
+        },
+        'results': run_benchmark(
+            args.sizes, args.repeat, args.seed, args.budget_per_student,
+            measure_memory=not args.no_memory
+        )
+    }
+    report['environment']['max_rss_bytes'] = max_rss_bytes()
+    
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(payload)
+    else:
+        print(payload)
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            comparison = compare(report, json.load(f), args.tolerance)
+        if comparison.empty:
+            print("비교할 항목이 없습니다: 기준 JSON과 학생 수·단계가 겹치지 않습니다.", file=sys.stderr)
+            return 2
+        print(comparison.to_string(index=False), file=sys.stderr)
+        if comparison['regression'].any():
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""Content-fingerprinted LRU cache for pipeline stage results"""
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def frame_fingerprint(df):
+    """Hash a DataFrame's columns, dtypes, index labels and cell values into a hex digest
+
+    The index is part of the hash because stage results refer to students by
+    row label: the same rows under different labels need different results.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    if len(df):
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def make_key(stage, *parts):
+    """Build a cache key from a stage name, upstream keys/fingerprints and parameters"""
+    return hashlib.blake2b(repr((stage,) + parts).encode(), digest_size=16).hexdigest()
+
+
+def estimate_size(value, seen=None):
+    """Approximate memory footprint of a cached value in bytes
+
+    Pass the same ``seen`` set across calls to count objects reachable from
+    several values (e.g. a frame held both in session state and the cache)
+    only once.
+    """
+    if seen is not None:
+        if id(value) in seen:
+            return 0
+        seen.add(id(value))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v, seen) for v in value)
+    return sys.getsizeof(value)
+
+
+def read_spilled(path):
+    """Read a spilled frame back and delete its file
+
+    Arrow hands back read-only buffers; the copy keeps the frame writable
+    like the one that was spilled, since some stages update results in place.
+    """
+    df = pd.read_parquet(path).copy()
+    os.remove(path)
+    return df
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by the total estimated size of its entries
+
+    Keys are expected to come from ``make_key`` so that a change in upstream
+    data or parameters yields a new key; stale entries are never hit again and
+    age out through eviction. With a ``spill_dir``, evicted DataFrames are
+    written there as Parquet instead of being dropped and are read back on
+    the next hit; other values are simply dropped.
+    """
+    
+    def __init__(self, max_bytes=512 * 1024 ** 2, spill_dir=None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.spill_hits = 0
+        self._entries = OrderedDict()
+        self._spilled = {}
+        self._lock = threading.Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+    
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries or key in self._spilled
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+    
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            path = self._spilled.pop(key, None)
+            if path is None:
+                self.misses += 1
+                return default
+            self.spill_hits += 1
+        value = read_spilled(path)
+        self.put(key, value)
+        return value
+    
+    def put(self, key, value):
+        size = estimate_size(value)
+        evicted = []
+        with self._lock:
+            self._forget(key)
+            if size > self.max_bytes:
+                evicted.append((key, value))
+            else:
+                self._entries[key] = (value, size)
+                self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                evicted_key, (evicted_value, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                evicted.append((evicted_key, evicted_value))
+        for evicted_key, evicted_value in evicted:
+            self._spill_value(evicted_key, evicted_value)
+    
+    def spill(self, key):
+        """Move ``key`` out of memory now, e.g. once it has been superseded
+
+        DataFrames go to disk when a ``spill_dir`` is set; anything else is dropped.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return
+            value, size = self._entries.pop(key)
+            self.current_bytes -= size
+        self._spill_value(key, value)
+    
+    def _spill_value(self, key, value):
+        if not self.spill_dir or not isinstance(value, pd.DataFrame):
+            return
+        path = os.path.join(self.spill_dir, f"{key}.parquet")
+        value.to_parquet(path)
+        with self._lock:
+            self._spilled[key] = path
+    
+    def _forget(self, key):
+        """Remove ``key`` from memory and disk; the caller holds the lock"""
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        path = self._spilled.pop(key, None)
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+    
+    def discard(self, key):
+        """Drop ``key`` if present, e.g. after its value was modified in place"""
+        with self._lock:
+            self._forget(key)
+    
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, computing and storing it on a miss"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+    
+    def holds(self, value):
+        """Whether this exact object is currently kept in memory by the cache"""
+        with self._lock:
+            return any(entry is value for entry, _ in self._entries.values())
+    
+    def stats(self):
+        """Entry counts, sizes and hit counters"""
+        with self._lock:
+            spilled_bytes = sum(
+                os.path.getsize(path) for path in self._spilled.values() if os.path.exists(path)
+            )
+            return {
+                'entries': len(self._entries),
+                'memory_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'spilled_entries': len(self._spilled),
+                'spilled_bytes': spilled_bytes,
+                'hits': self.hits,
+                'spill_hits': self.spill_hits,
+                'misses': self.misses
+            }
+    
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries) + list(self._spilled):
+                self._forget(key)
+            self.current_bytes = 0
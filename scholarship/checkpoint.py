@@ -0,0 +1,221 @@
+"""On-disk checkpoints of the student data and stage results for fast restarts
+
+Every frame is written column by column into its own directory:
+
+- numeric, boolean and datetime columns as ``.npy`` files,
+- categoricals as a ``.npy`` code array, with the categories in the manifest,
+- text as the Arrow string buffers (offsets and UTF-8 data, as ``.npy``).
+
+Loading maps the files with ``mmap_mode='r'`` and wraps them without
+copying or parsing, so resuming even a million-student session only reads
+the pages that are actually touched. Frames loaded this way are read-only:
+copy before changing them in place. A ``checkpoint.json`` next to the frames
+holds the keys the results were computed under and the (small) TO result.
+"""
+import json
+import os
+import shutil
+import threading
+import uuid
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .memory import SpilledFrame
+
+MANIFEST = 'manifest.json'
+META_FILE = 'checkpoint.json'
+META_KEYS = ['students_fingerprint', 'ranking_key', 'ranking_params', 'quota_key', 'assignment_key']
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _write_json(path, value):
+    """Write ``value`` to ``path`` atomically"""
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(value, f, ensure_ascii=False, default=_json_default)
+    os.replace(tmp, path)
+
+
+def _text_buffers(series):
+    """Offsets, UTF-8 data and validity (None without missing values) of a text column"""
+    values = series.astype(object).where(series.notna(), None)
+    array = pa.array(values, type=pa.large_string(), from_pandas=True)
+    offsets = np.frombuffer(array.buffers()[1], dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+    data = array.buffers()[2]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.zeros(0, dtype=np.uint8)
+    valid = array.is_valid().to_numpy(zero_copy_only=False) if array.null_count else None
+    return offsets, data, valid
+
+
+def _text_column(offsets, data, valid):
+    """A pandas string array over the mapped Arrow buffers (no copy)"""
+    length = len(offsets) - 1
+    bitmap = None if valid is None else pa.py_buffer(np.packbits(valid, bitorder='little'))
+    array = pa.Array.from_buffers(
+        pa.large_string(), length, [bitmap, pa.py_buffer(offsets), pa.py_buffer(data)],
+        null_count=0 if valid is None else length - int(valid.sum())
+    )
+    return pd.array(array, dtype=pd.StringDtype('pyarrow', na_value=np.nan))
+
+
+def save_frame(path, df):
+    """Write ``df`` as a checkpoint directory at ``path``, replacing any previous one"""
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    os.makedirs(tmp)
+    columns = []
+    for i, (name, series) in enumerate(df.items()):
+        entry = {'name': name, 'file': f"c{i}"}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            entry.update(
+                kind='category',
+                categories=series.cat.categories.tolist(),
+                ordered=bool(series.cat.ordered)
+            )
+            np.save(os.path.join(tmp, f"c{i}.npy"), series.cat.codes.to_numpy())
+        elif isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biufcmM':
+            entry['kind'] = 'numeric'
+            np.save(os.path.join(tmp, f"c{i}.npy"), series.to_numpy())
+        else:
+            entry['kind'] = 'text'
+            offsets, data, valid = _text_buffers(series)
+            np.save(os.path.join(tmp, f"c{i}.offsets.npy"), offsets)
+            np.save(os.path.join(tmp, f"c{i}.data.npy"), data)
+            entry['nullable'] = valid is not None
+            if valid is not None:
+                np.save(os.path.join(tmp, f"c{i}.valid.npy"), valid)
+        columns.append(entry)
+    
+    if isinstance(df.index, pd.RangeIndex):
+        index = {'start': df.index.start, 'stop': df.index.stop, 'step': df.index.step}
+    else:
+        index = None
+        np.save(os.path.join(tmp, 'index.npy'), df.index.to_numpy())
+    _write_json(os.path.join(tmp, MANIFEST), {'rows': len(df), 'index': index, 'columns': columns})
+    
+    old = None
+    if os.path.exists(path):
+        old = f"{path}.{uuid.uuid4().hex}.old"
+        os.replace(path, old)
+    os.replace(tmp, path)
+    if old is not None:
+        # Frames already mapped from the old files stay valid on POSIX systems
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def load_frame(path):
+    """The frame checkpointed at ``path``, backed by read-only memory maps"""
+    with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    
+    def mapped(file):
+        # A plain ndarray view of the map, so pandas does not carry the memmap subclass around
+        return np.asarray(np.load(os.path.join(path, file), mmap_mode='r'))
+    
+    columns = {}
+    for entry in manifest['columns']:
+        if entry['kind'] == 'category':
+            dtype = pd.CategoricalDtype(entry['categories'], ordered=entry['ordered'])
+            columns[entry['name']] = pd.Categorical.from_codes(mapped(entry['file'] + '.npy'), dtype=dtype)
+        elif entry['kind'] == 'numeric':
+            columns[entry['name']] = mapped(entry['file'] + '.npy')
+        else:
+            valid = mapped(entry['file'] + '.valid.npy') if entry['nullable'] else None
+            columns[entry['name']] = _text_column(
+                mapped(entry['file'] + '.offsets.npy'), mapped(entry['file'] + '.data.npy'), valid
+            )
+    
+    index = manifest['index']
+    index = pd.RangeIndex(**index) if index is not None else pd.Index(mapped('index.npy'))
+    return pd.DataFrame(columns, index=index, copy=False)
+
+
+def directory_size(path):
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+
+class CheckpointFrame(SpilledFrame):
+    """Stand-in for a checkpointed frame that is only mapped once a page needs it
+
+    Unlike a spilled frame, loading leaves the checkpoint on disk.
+    """
+    
+    def load(self):
+        return load_frame(self.path)
+
+
+class Checkpoints:
+    """The latest students, ranking, TO and assignment checkpoints in one directory
+
+    Saves replace one piece at a time and record its key in ``checkpoint.json``,
+    so a restart restores each piece under the key it was computed with.
+    Meant for one server process; several sessions of it may save concurrently.
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+    
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+    
+    def meta(self):
+        """Keys of the checkpointed pieces (None for missing ones) and the TO result"""
+        meta = dict.fromkeys(META_KEYS)
+        meta['quota_results'] = {}
+        try:
+            with open(self._path(META_FILE), encoding='utf-8') as f:
+                meta.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        return meta
+    
+    def _update_meta(self, **values):
+        meta = self.meta()
+        meta.update(values)
+        _write_json(self._path(META_FILE), meta)
+    
+    def _save(self, name, frame, **keys):
+        """Checkpoint ``frame`` (or remove the checkpoint when it is None) and record ``keys``"""
+        with self._lock:
+            if frame is not None:
+                save_frame(self._path(name), frame)
+            else:
+                shutil.rmtree(self._path(name), ignore_errors=True)
+            self._update_meta(**keys)
+    
+    def frame(self, name):
+        """A ``CheckpointFrame`` for the named piece, or None if it was not saved"""
+        path = self._path(name)
+        try:
+            with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+                rows = json.load(f)['rows']
+        except FileNotFoundError:
+            return None
+        return CheckpointFrame(path, rows, directory_size(path))
+    
+    def save_students(self, students, fingerprint):
+        self._save('students', students, students_fingerprint=fingerprint)
+    
+    def load_students(self):
+        checkpoint = self.frame('students')
+        return checkpoint.load() if checkpoint is not None else None
+    
+    def save_rankings(self, ranking, key, params=None):
+        self._save('rankings', ranking, ranking_key=key, ranking_params=params)
+    
+    def save_quotas(self, quota_results, key):
+        with self._lock:
+            self._update_meta(quota_results=quota_results or {}, quota_key=key)
+    
+    def save_assignments(self, assignments, key):
+        if assignments is not None and assignments.empty:
+            assignments = None
+        self._save('assignments', assignments, assignment_key=key)
@@ -0,0 +1,23 @@
+"""Eligibility screening for grade-based scholarships"""
+
+
+def filter_eligible(students, min_gpa=2.0, min_credits=12, exclude_inactive=True):
+    """Return the students who may be ranked for a scholarship"""
+    mask = (
+        (students['prev_semester_gpa'] >= min_gpa) &
+        (students['prev_semester_credits'] >= min_credits)
+    )
+    if exclude_inactive:
+        mask &= students['academic_status'] == '재학'
+    return students[mask]
+
+
+def check_eligibility(students, min_gpa, min_credits, allowed_statuses, excluded_categories):
+    """Split students into (eligible, ineligible) frames"""
+    mask = (
+        (students['prev_semester_gpa'] >= min_gpa) &
+        (students['prev_semester_credits'] >= min_credits) &
+        (students['academic_status'].isin(allowed_statuses)) &
+        (~students['admission_category'].isin(excluded_categories))
+    )
+    return students[mask].copy(), students[~mask]
@@ -0,0 +1,85 @@
+"""Serialization of result tables for download"""
+import io
+
+# Data rows per worksheet (Excel's limit minus the header row)
+EXCEL_MAX_ROWS = 1048575
+
+# Excel number formats for amount and ratio columns; the cells stay numeric
+EXCEL_NUMBER_FORMATS = {
+    '배정예산': '#,##0',
+    '총장학금': '#,##0',
+    '장학금': '#,##0',
+    'scholarship_amount': '#,##0',
+    '비율': '0.0%'
+}
+
+
+def csv_bytes(df):
+    """Encode a DataFrame as UTF-8 CSV with a BOM so Excel detects the encoding"""
+    return df.to_csv(index=False).encode('utf-8-sig')
+
+
+def parquet_bytes(df):
+    """Encode a DataFrame as Parquet, preserving categorical and numeric dtypes"""
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+def _sheet_rows(ws, df, start, stop, number_formats, chunk_size):
+    """Append rows ``start:stop`` of ``df`` to a write-only sheet, chunk by chunk"""
+    from openpyxl.cell import WriteOnlyCell
+    
+    formatted = [
+        (i, number_formats[col]) for i, col in enumerate(df.columns)
+        if col in number_formats
+    ]
+    for chunk_start in range(start, stop, chunk_size):
+        chunk = df.iloc[chunk_start:min(chunk_start + chunk_size, stop)]
+        values = chunk.astype(object).where(chunk.notna(), None).to_numpy()
+        for row in values.tolist():
+            for i, number_format in formatted:
+                if row[i] is not None:
+                    cell = WriteOnlyCell(ws, row[i])
+                    cell.number_format = number_format
+                    row[i] = cell
+            ws.append(row)
+
+
+def write_excel(sheets, target, number_formats=None, chunk_size=10000):
+    """Write ``{sheet name: DataFrame}`` to an .xlsx path or file object
+
+    Uses openpyxl's write-only mode, so rows are streamed to disk and memory
+    stays flat however long the sheets are. Values keep their numeric type;
+    ``number_formats`` (default ``EXCEL_NUMBER_FORMATS``) only sets how
+    columns are displayed. Frames longer than one worksheet continue on
+    ``"<name> (2)"`` and so on.
+    """
+    # openpyxl is imported on first use; it is slow to import and only exports need it
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    
+    if number_formats is None:
+        number_formats = EXCEL_NUMBER_FORMATS
+    
+    wb = Workbook(write_only=True)
+    bold = Font(bold=True)
+    for name, df in sheets.items():
+        for part, start in enumerate(range(0, max(len(df), 1), EXCEL_MAX_ROWS)):
+            ws = wb.create_sheet(name if part == 0 else f"{name} ({part + 1})")
+            header = []
+            for col in df.columns:
+                cell = WriteOnlyCell(ws, str(col))
+                cell.font = bold
+                header.append(cell)
+            ws.append(header)
+            _sheet_rows(ws, df, start, min(start + EXCEL_MAX_ROWS, len(df)), number_formats, chunk_size)
+    wb.save(target)
+
+
+def excel_bytes(sheets, number_formats=None):
+    """Encode ``{sheet name: DataFrame}`` as an .xlsx workbook"""
+    buffer = io.BytesIO()
+    write_excel(sheets, buffer, number_formats)
+    return buffer.getvalue()
@@ -0,0 +1,91 @@
+"""Precomputed row-position indexes for the selectbox filters and table paging"""
+import numpy as np
+import pandas as pd
+
+
+class FilterIndex:
+    """Map each value of the indexed columns to the row positions holding it
+
+    Built once per dataset version; filtered views are then the intersection
+    of a few position arrays followed by one ``take`` of just those rows,
+    instead of a full-frame copy and a boolean mask per selectbox.
+    """
+    
+    def __init__(self, df, columns):
+        self.n_rows = len(df)
+        self._codes = {}
+        self._positions = {}
+        self._options = {}
+        for col in columns:
+            codes, uniques = pd.factorize(df[col])
+            valid = codes >= 0
+            order = np.argsort(codes, kind='stable')[np.count_nonzero(~valid):]
+            bounds = np.cumsum(np.bincount(codes[valid], minlength=len(uniques)))[:-1]
+            self._positions[col] = dict(zip(uniques, np.split(order, bounds)))
+            self._options[col] = list(uniques)
+            self._codes[col] = codes
+    
+    def __sizeof__(self):
+        return sum(codes.nbytes for codes in self._codes.values()) + sum(
+            positions.nbytes
+            for mapping in self._positions.values()
+            for positions in mapping.values()
+        )
+    
+    def options(self, col, **filters):
+        """Distinct values of ``col`` in order of first appearance, optionally within a filter"""
+        positions = self.positions(**filters)
+        if positions is None:
+            return list(self._options[col])
+        codes = pd.unique(self._codes[col][positions])
+        return [self._options[col][code] for code in codes if code >= 0]
+    
+    def positions(self, **filters):
+        """Sorted row positions matching every ``column=value`` filter, or None for all rows
+
+        Filters set to None or '전체' are ignored.
+        """
+        selected = [
+            self._positions[col].get(value, np.empty(0, dtype=np.intp))
+            for col, value in filters.items()
+            if value is not None and value != '전체'
+        ]
+        if not selected:
+            return None
+        selected.sort(key=len)
+        result = selected[0]
+        for positions in selected[1:]:
+            result = np.intersect1d(result, positions, assume_unique=True)
+        return result
+    
+    def view(self, df, **filters):
+        """Rows of ``df`` (the indexed frame) matching the filters"""
+        positions = self.positions(**filters)
+        return df if positions is None else df.take(positions)
+
+
+def search_positions(df, columns, text, positions=None):
+    """Row positions (optionally within ``positions``) where any of ``columns`` contains ``text``"""
+    if positions is None:
+        positions = np.arange(len(df))
+    if not text:
+        return positions
+    subset = df.iloc[positions]
+    hit = np.zeros(len(subset), dtype=bool)
+    for col in columns:
+        hit |= subset[col].astype(str).str.contains(text, regex=False, na=False).to_numpy()
+    return positions[hit]
+
+
+def order_positions(df, columns, ascending=True, positions=None):
+    """``positions`` (all rows by default) reordered by ``columns``
+
+    Only the sort columns are touched, so the rest of the frame is never copied.
+    """
+    if positions is None:
+        positions = np.arange(len(df))
+    if not columns:
+        return positions
+    keys = df[list(columns)].iloc[positions].reset_index(drop=True)
+    order = keys.sort_values(list(columns), ascending=ascending, kind='stable').index.to_numpy()
+    return positions[order]
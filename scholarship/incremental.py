@@ -0,0 +1,121 @@
+"""Incremental re-ranking for single-record corrections during the appeal period"""
+import numpy as np
+import pandas as pd
+
+from .eligibility import filter_eligible
+from .ranking import compute_rankings
+from .views import student_columns
+
+
+def _set_rows(frame, positions, col, values):
+    """Write ``values`` into ``frame[col]`` at ``positions``, widening the column if needed
+
+    New categories are added in sorted order and integer columns are widened
+    when a value does not fit (or to float when it is missing/fractional).
+    """
+    values = pd.Series(values).reset_index(drop=True)
+    dtype = frame[col].dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        new = pd.Index(values.dropna().unique()).difference(dtype.categories)
+        if len(new):
+            frame[col] = frame[col].cat.set_categories(dtype.categories.append(new).sort_values())
+        values = values.astype(object)
+    elif pd.api.types.is_integer_dtype(dtype):
+        if values.isna().any() or not pd.api.types.is_integer_dtype(values.dtype):
+            frame[col] = frame[col].astype('float64')
+        elif len(values) and (values.min() < np.iinfo(dtype).min or values.max() > np.iinfo(dtype).max):
+            frame[col] = frame[col].astype('int64')
+        values = values.astype(frame[col].dtype)
+    frame.iloc[positions, frame.columns.get_loc(col)] = values.to_numpy()
+
+
+def apply_student_updates(students, updates, key='student_id'):
+    """Write corrected student records into ``students`` in place
+
+    ``updates`` holds the key column plus any columns to overwrite. Returns the
+    row positions that were updated; unknown keys raise KeyError.
+    """
+    # Scan for the few matching rows instead of hashing the whole key column
+    matches = np.flatnonzero(students[key].isin(updates[key]).to_numpy())
+    positions = pd.Index(students[key].iloc[matches]).get_indexer(updates[key])
+    if (positions < 0).any():
+        missing = updates[key][positions < 0].tolist()
+        raise KeyError(f"학생을 찾을 수 없습니다: {', '.join(map(str, missing))}")
+    positions = matches[positions]
+    
+    for col in updates.columns:
+        if col == key:
+            continue
+        _set_rows(students, positions, col, updates[col])
+    return positions
+
+
+def rerank_students(ranking, students, student_ids, min_gpa=2.0, min_credits=12, exclude_inactive=True):
+    """Re-rank only the (department, grade) partitions touched by ``student_ids``
+
+    ``ranking`` is the thin ranking of ``students`` (see ``compute_rankings``)
+    and ``students`` must already contain the corrected records. Affected
+    partitions are rebuilt from their unchanged members plus the corrected
+    students that are still eligible, and ranked with ``compute_rankings``.
+    When every partition keeps its size (the usual grade correction) the new
+    rows are written into ``ranking`` in place; otherwise a re-stitched frame
+    is returned.
+
+    Returns ``(ranking, moved)`` where ``moved`` lists the students whose
+    rank changed (``rank_before``/``rank_after`` are NaN for students who
+    entered or left the ranking).
+    """
+    student_ids = pd.Index(student_ids)
+    updated = students[students['student_id'].isin(student_ids)]
+    updated_eligible = filter_eligible(updated, min_gpa, min_credits, exclude_inactive)
+    
+    # Partitions are the runs starting at rank 1, named after their first member
+    # other than the corrected students (whose records may have moved)
+    groups = np.cumsum(ranking['rank'].to_numpy() == 1) - 1
+    previous = ranking['row'].isin(updated.index).to_numpy()
+    others = np.flatnonzero(~previous)
+    firsts = others[np.r_[True, groups[others][1:] != groups[others][:-1]]] if len(others) else others
+    names = student_columns(ranking.iloc[firsts], students, ['department', 'grade'])
+    partition_names = dict(zip(groups[firsts], zip(names['department'], names['grade'])))
+    
+    new_partitions = set(zip(updated_eligible['department'], updated_eligible['grade']))
+    touched = set(groups[previous])
+    touched |= {group for group, name in partition_names.items() if name in new_partitions}
+    affected = np.isin(groups, list(touched))
+    positions = np.flatnonzero(affected)
+    
+    before = student_columns(ranking.iloc[positions], students, ['student_id', 'department', 'grade'])
+    before['rank'] = ranking['rank'].to_numpy()[positions]
+    
+    # Unchanged members of the affected partitions plus the corrected records, in
+    # their order in ``students`` so that exact ties break as in a full re-rank
+    pool_rows = np.concatenate([
+        ranking['row'].to_numpy()[affected & ~previous],
+        updated_eligible.index.to_numpy()
+    ])
+    pool = students.take(np.sort(students.index.get_indexer(pool_rows)))
+    reranked = compute_rankings(pool)
+    reranked_names = student_columns(reranked[reranked['rank'] == 1], students, ['department', 'grade'])
+    
+    same_layout = (
+        len(positions) == len(reranked) and
+        (ranking['rank'].to_numpy()[positions] == reranked['rank'].to_numpy()).all() and
+        [partition_names.get(group) for group in sorted(touched)] ==
+        list(zip(reranked_names['department'], reranked_names['grade']))
+    )
+    
+    if same_layout:
+        for col in ('row', 'rank'):
+            _set_rows(ranking, positions, col, reranked[col])
+    else:
+        combined = pd.concat([ranking[~affected], reranked], ignore_index=True)
+        keys = student_columns(combined, students, ['department', 'grade'])
+        dept_codes, _ = pd.factorize(keys['department'], sort=True)
+        grade_codes, _ = pd.factorize(keys['grade'], sort=True)
+        ranking = combined.take(np.lexsort((grade_codes, dept_codes))).reset_index(drop=True)
+    
+    after = student_columns(reranked, students, ['student_id', 'department', 'grade'])
+    after['rank'] = reranked['rank'].to_numpy()
+    moved = before.merge(after, on='student_id', how='outer', suffixes=('_before', '_after'))
+    moved = moved[moved['rank_before'].ne(moved['rank_after'])]
+    return ranking, moved.reset_index(drop=True)
@@ -0,0 +1,151 @@
+"""Memory accounting and spill-to-disk for per-session intermediates
+
+``session_memory`` lists the deep size of every entry in a session state
+mapping, counting objects reachable from several entries once and flagging
+those shared with other sessions (through the ``ResultCache`` or a
+``SharedFrames`` registry). When a session's own frames grow past its budget,
+``enforce_budget`` writes the largest frames not needed by the current page
+to Parquet and leaves a ``SpilledFrame`` in their place; ``restore_frames``
+reads them back when a page needs them again.
+"""
+import os
+import threading
+import uuid
+import weakref
+
+import pandas as pd
+
+from .cache import estimate_size, read_spilled
+
+
+class SpilledFrame:
+    """Stand-in for a DataFrame that was written to disk
+
+    Supports ``empty`` and ``len()`` so that status checks do not need the
+    data; ``load`` reads the frame back and deletes the file.
+    """
+    
+    def __init__(self, path, rows, nbytes):
+        self.path = path
+        self.rows = rows
+        self.nbytes = nbytes
+    
+    @property
+    def empty(self):
+        return self.rows == 0
+    
+    def __len__(self):
+        return self.rows
+    
+    def load(self):
+        return read_spilled(self.path)
+
+
+def session_memory(state, shared=()):
+    """Deep size of every session state entry, largest first
+
+    Columns: 항목, 종류, 행 수, 크기(MB) (in memory), 디스크(MB) (spilled)
+    and 공유 (the same object is also held by one of ``shared``, e.g. the
+    result cache or the ``SharedFrames`` registry, so it is not this
+    session's alone).
+    """
+    seen = set()
+    rows = []
+    for key in list(state.keys()):
+        value = state[key]
+        spilled = isinstance(value, SpilledFrame)
+        rows.append({
+            '항목': key,
+            '종류': 'DataFrame (디스크)' if spilled else type(value).__name__,
+            '행 수': len(value) if spilled or isinstance(value, (pd.DataFrame, pd.Series)) else None,
+            '크기(MB)': 0.0 if spilled else estimate_size(value, seen) / 1024 ** 2,
+            '디스크(MB)': value.nbytes / 1024 ** 2 if spilled else 0.0,
+            '공유': not spilled and any(holder.holds(value) for holder in shared)
+        })
+    table = pd.DataFrame(rows, columns=['항목', '종류', '행 수', '크기(MB)', '디스크(MB)', '공유'])
+    table['행 수'] = table['행 수'].astype('Int64')
+    return table.sort_values('크기(MB)', ascending=False, ignore_index=True)
+
+
+def owned_bytes(table):
+    """Memory held by the session alone, from a ``session_memory`` table"""
+    return table.loc[~table['공유'], '크기(MB)'].sum() * 1024 ** 2
+
+
+class SharedFrames:
+    """Process-wide registry that hands every session the same frame for the same content
+
+    Frames are held weakly, so one lives as long as some session still
+    refers to it. Shared frames are read-only by convention: a session that
+    changes one (e.g. corrects a record) works on its own copy.
+    """
+    
+    def __init__(self):
+        self._frames = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._frames)
+    
+    def intern(self, key, frame):
+        """The frame registered under ``key``, registering ``frame`` if there is none"""
+        with self._lock:
+            existing = self._frames.get(key)
+            if existing is not None:
+                return existing
+            self._frames[key] = frame
+            return frame
+    
+    def get_or_load(self, key, load):
+        """The frame registered under ``key``, loading and registering it on a miss"""
+        with self._lock:
+            existing = self._frames.get(key)
+        if existing is not None:
+            return existing
+        frame = load()
+        return frame if frame is None else self.intern(key, frame)
+    
+    def holds(self, value):
+        with self._lock:
+            return any(frame is value for frame in self._frames.values())
+
+
+def spill_frame(state, key, spill_dir):
+    """Write the DataFrame at ``state[key]`` to ``spill_dir`` and replace it with a ``SpilledFrame``"""
+    df = state[key]
+    os.makedirs(spill_dir, exist_ok=True)
+    path = os.path.join(spill_dir, f"{key}-{uuid.uuid4().hex}.parquet")
+    df.to_parquet(path)
+    state[key] = SpilledFrame(path, len(df), os.path.getsize(path))
+
+
+def restore_frames(state, keys):
+    """Read back any of ``keys`` that were spilled"""
+    for key in keys:
+        value = state.get(key)
+        if isinstance(value, SpilledFrame):
+            state[key] = value.load()
+
+
+def enforce_budget(state, max_bytes, spill_dir, frames, keep=(), shared=()):
+    """Spill the largest of ``frames`` outside ``keep`` until the session fits in ``max_bytes``
+
+    Only the listed keys are spilled: everything that reads them must go
+    through ``restore_frames`` (or only use ``empty``/``len()``) first.
+    Frames held by one of ``shared`` neither count towards the budget nor
+    get spilled, since dropping this session's reference would free nothing.
+    Returns the spilled keys.
+    """
+    table = session_memory(state, shared)
+    total = owned_bytes(table)
+    spilled = []
+    for row in table[~table['공유']].to_dict('records'):
+        if total <= max_bytes:
+            break
+        key = row['항목']
+        if key not in frames or key in keep or not isinstance(state[key], pd.DataFrame) or state[key].empty:
+            continue
+        spill_frame(state, key, spill_dir)
+        total -= row['크기(MB)'] * 1024 ** 2
+        spilled.append(key)
+    return spilled
@@ -0,0 +1,229 @@
+"""Headless ranking → TO → assignment pipeline and its command-line entry point
+
+Example::
+
+    python -m scholarship students.parquet --config config.json --output-dir out
+    python -m scholarship --sample 100000 --output-dir out --format parquet
+    python -m scholarship --batch jobs.json --output-dir out --workers 4
+"""
+import argparse
+import json
+import os
+import sys
+
+import pandas as pd
+
+from .assignment import DEFAULT_SCHOLARSHIP_AMOUNTS, assign_scholarships
+from .eligibility import filter_eligible
+from .export import write_excel
+from .quota import calculate_quotas, department_quotas, quota_table
+from .ranking import compute_rankings
+from .report import summarize_recipients, workbook_sheets, write_text_report
+from .sample import generate_sample_data
+from .schema import normalize_students, read_students_csv
+from .views import join_students
+
+DEFAULT_CONFIG = {
+    'min_gpa': 2.0,
+    'min_credits': 12,
+    'exclude_inactive': True,
+    'total_budget': 500000000,
+    'scholarship_amounts': DEFAULT_SCHOLARSHIP_AMOUNTS,
+    'budget_shares': None,
+    'assignment_semester': None
+}
+
+
+def load_config(path=None, **overrides):
+    """Merge a JSON config file and keyword overrides onto DEFAULT_CONFIG"""
+    config = dict(DEFAULT_CONFIG)
+    if path:
+        with open(path, encoding='utf-8') as f:
+            config.update(json.load(f))
+    config.update({k: v for k, v in overrides.items() if v is not None})
+    return config
+
+
+STUDENT_FILE_TYPES = ['csv', 'parquet', 'feather', 'arrow']
+
+
+def load_students(source, file_name=None):
+    """Read student data from a CSV, Parquet or Arrow IPC (Feather) file
+
+    ``source`` may be a path or a file object; the format is chosen from
+    ``file_name``, the object's ``name`` attribute or the path itself.
+    Parquet and Arrow files keep their stored dtypes (categoricals, integer
+    widths) instead of having them re-inferred.
+    """
+    name = str(file_name or getattr(source, 'name', source)).lower()
+    if name.endswith('.parquet'):
+        return pd.read_parquet(source)
+    if name.endswith(('.feather', '.arrow')):
+        return pd.read_feather(source)
+    return pd.read_csv(source)
+
+
+def read_input(path, chunksize=100000):
+    """Read a student file; CSV goes through chunked validation
+
+    Returns ``(students, error_report, rejected_count)``; the error report is
+    None for formats that are not validated row by row.
+    """
+    if str(path).lower().endswith('.csv'):
+        return read_students_csv(path, chunksize=chunksize)
+    return load_students(path), None, 0
+
+
+def write_rejected_rows(error_report, output_dir):
+    """Save the rows rejected by CSV validation and return the file path"""
+    path = os.path.join(output_dir, 'rejected_rows.csv')
+    error_report.to_csv(path, index=False, encoding='utf-8-sig')
+    return path
+
+
+def run_pipeline(students, config=None):
+    """Run eligibility, ranking, TO calculation and assignment on a student frame
+
+    ``rankings`` and ``recipients`` in the returned dict are thin frames
+    over ``students``; ``write_outputs`` joins the student columns back.
+    """
+    if config is None:
+        config = DEFAULT_CONFIG
+    
+    eligible = filter_eligible(
+        students,
+        min_gpa=config['min_gpa'],
+        min_credits=config['min_credits'],
+        exclude_inactive=config['exclude_inactive']
+    )
+    rankings = compute_rankings(eligible)
+    quotas = calculate_quotas(
+        students,
+        config['total_budget'],
+        config['scholarship_amounts'],
+        config['budget_shares']
+    )
+    recipients = assign_scholarships(
+        rankings,
+        quotas,
+        students,
+        scholarship_amounts=config['scholarship_amounts'],
+        assignment_semester=config['assignment_semester']
+    )
+    
+    return {
+        'students': students,
+        'rankings': rankings,
+        'quotas': quotas,
+        'quota_table': quota_table(quotas),
+        'department_quotas': department_quotas(students, quotas),
+        'recipients': recipients,
+        'summary': (
+            summarize_recipients(join_students(recipients, students, ['student_id', 'college']))
+            if not recipients.empty else pd.DataFrame()
+        )
+    }
+
+
+def write_outputs(results, output_dir, file_format='csv', include_report=False):
+    """Write pipeline results to ``output_dir`` and return the written paths
+
+    ``file_format`` is 'csv' or 'parquet' for one file per table, or 'xlsx'
+    for a single workbook with one sheet per table plus summary pivots.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    rankings = join_students(results['rankings'], results['students'])
+    recipients = join_students(results['recipients'], results['students'])
+    
+    if file_format == 'xlsx':
+        path = os.path.join(output_dir, 'results.xlsx')
+        write_excel(workbook_sheets(
+            rankings,
+            results['quota_table'],
+            results['department_quotas'],
+            recipients
+        ), path)
+        written = [path]
+    else:
+        tables = {
+            'rankings': rankings,
+            'quotas': results['quota_table'],
+            'department_quotas': results['department_quotas'],
+            'recipients': recipients,
+            'summary': results['summary']
+        }
+        
+        written = []
+        for name, df in tables.items():
+            path = os.path.join(output_dir, f"{name}.{file_format}")
+            if file_format == 'parquet':
+                df.to_parquet(path, index=False)
+            else:
+                df.to_csv(path, index=False, encoding='utf-8-sig')
+            written.append(path)
+    
+    if include_report and not recipients.empty:
+        path = os.path.join(output_dir, 'report.txt')
+        write_text_report(recipients, path)
+        written.append(path)
+    
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m scholarship',
+        description="성적 우수 장학금 배치 실행 (FUR-004/005/006)"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('input', nargs='?', help="학생 데이터 파일 (.csv, .parquet, .feather, .arrow)")
+    source.add_argument('--sample', type=int, metavar='N', help="N명의 샘플 데이터로 실행")
+    source.add_argument('--batch', metavar='MANIFEST', help="캠퍼스/학기별 작업 목록(JSON 또는 CSV)을 병렬 실행")
+    parser.add_argument('--config', help="예산/장학금/자격 요건 설정 JSON 파일")
+    parser.add_argument('--budget', type=int, help="총 장학 예산 (원), 설정 파일보다 우선")
+    parser.add_argument('--semester', help="배정 학기 (예: 2024-1)")
+    parser.add_argument('--output-dir', default='output', help="결과 저장 디렉터리")
+    parser.add_argument('--format', choices=['csv', 'parquet', 'xlsx'], default='csv', help="결과 파일 형식")
+    parser.add_argument('--report', action='store_true', help="텍스트 보고서(report.txt)도 저장")
+    parser.add_argument('--chunksize', type=int, default=100000, help="CSV 청크 단위 검증 읽기의 청크 크기")
+    parser.add_argument('--workers', type=int, help="--batch 동시 실행 프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args(argv)
+    
+    config = load_config(args.config, total_budget=args.budget, assignment_semester=args.semester)
+    
+    if args.batch:
+        from .batch import load_jobs, run_batch  # batch builds on this module
+        summary = run_batch(
+            load_jobs(args.batch),
+            args.output_dir,
+            base_config=config,
+            file_format=args.format,
+            include_report=args.report,
+            chunksize=args.chunksize,
+            max_workers=args.workers
+        )
+        print(summary.to_string(index=False))
+        print(f"  {os.path.join(args.output_dir, 'batch_summary.csv')}")
+        return 0 if (summary['상태'] == '완료').all() else 1
+    
+    error_report, rejected_count = None, 0
+    if args.sample is not None:
+        students = generate_sample_data(args.sample)
+    else:
+        students, error_report, rejected_count = read_input(args.input, args.chunksize)
+    
+    results = run_pipeline(normalize_students(students), config)
+    written = write_outputs(results, args.output_dir, args.format, include_report=args.report)
+    
+    if rejected_count:
+        written.append(write_rejected_rows(error_report, args.output_dir))
+        print(f"검증 실패로 제외된 행: {rejected_count:,}개", file=sys.stderr)
+    
+    print(f"학생 {len(students):,}명 → 순위 대상 {len(results['rankings']):,}명 → 선정 {len(results['recipients']):,}명")
+    for path in written:
+        print(f"  {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Budget and TO (quota) calculation (FUR-005)"""
+import pandas as pd
+
+from .allocation import DEFAULT_SCHOLARSHIP_AMOUNTS, allocate_quotas, split_quotas
+
+
+def calculate_quotas(students, total_budget, scholarship_amounts=None, budget_shares=None):
+    """Apportion the university-wide TO to colleges by enrollment
+
+    Returns ``{college: {'enrollment', 'ratio', 'budget', 'total_budget',
+    'amounts', 'quotas'}}`` where ``budget`` is what the college's TO costs;
+    summed over colleges it never exceeds ``total_budget``, which every entry
+    records as the budget the TO was bought from, along with the ``amounts``
+    it was priced at. See ``allocation.allocate_quotas``.
+    """
+    if scholarship_amounts is None:
+        scholarship_amounts = DEFAULT_SCHOLARSHIP_AMOUNTS
+    
+    colleges = allocate_quotas(
+        students, total_budget, scholarship_amounts, budget_shares, levels=('college',)
+    )
+    types = list(scholarship_amounts)
+    total_enrollment = colleges['재학생수'].sum()
+    
+    budget_allocation = {}
+    for row in colleges.to_dict('records'):
+        quotas = {scholarship_type: int(row[scholarship_type]) for scholarship_type in types}
+        budget_allocation[row['college']] = {
+            'enrollment': int(row['재학생수']),
+            'ratio': row['재학생수'] / total_enrollment,
+            'budget': sum(quotas[t] * scholarship_amounts[t] for t in types),
+            'total_budget': total_budget,
+            'amounts': dict(scholarship_amounts),
+            'quotas': quotas
+        }
+    
+    return budget_allocation
+
+
+def quota_amounts(quota_results):
+    """Amount per award type that ``quota_results`` was priced at
+
+    Falls back to the default amounts for results saved without them.
+    """
+    amounts = dict(DEFAULT_SCHOLARSHIP_AMOUNTS)
+    for data in quota_results.values():
+        amounts.update(data.get('amounts') or {})
+    return amounts
+
+
+def quota_table(quota_results):
+    """Flatten quota results into one row per college"""
+    rows = []
+    for college, data in quota_results.items():
+        row = {
+            '단과대학': college,
+            '재학생수': data['enrollment'],
+            '비율': data['ratio'],
+            '배정예산': data['budget']
+        }
+        for scholarship_type, quota in data['quotas'].items():
+            row[f'{scholarship_type}TO'] = quota
+        row['총TO'] = sum(data['quotas'].values())
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def department_quotas(students, quota_results):
+    """Apportion each college's TO to its departments by enrollment
+
+    Department TOs add up exactly to the college TO (largest remainder).
+    """
+    active = students[students['academic_status'] == '재학']
+    enrollment = active.groupby(['college', 'department'], observed=True).size()
+    quotas = split_quotas(students, quota_results, levels=('college', 'department'))
+    types = list(quotas.columns)
+    
+    dept_details = quotas.index.to_frame(index=False)
+    dept_details.columns = ['단과대학', '학과']
+    dept_details['재학생수'] = enrollment.reindex(quotas.index).to_numpy()
+    for scholarship_type in types:
+        dept_details[f"{scholarship_type.replace('장학', '')}TO"] = quotas[scholarship_type].to_numpy()
+    dept_details['계'] = quotas.sum(axis=1).to_numpy()
+    return dept_details
@@ -0,0 +1,50 @@
+"""Grade ranking (FUR-004)"""
+import numpy as np
+import pandas as pd
+
+RANK_KEYS = ['prev_semester_gpa', 'prev_semester_credits', 'prev_semester_major_credits']
+
+
+def compute_rankings(eligible):
+    """Rank students within each department and grade
+
+    Students are ordered by GPA, then earned credits, then major credits (all
+    descending); remaining ties keep their input order. One global stable
+    lexsort replaces the per-group sort, and ranks come from each row's offset
+    from the start of its (department, grade) run.
+
+    Returns a thin frame in (department, grade, rank) order: ``row``, the
+    student's index label in ``eligible``, and ``rank``. Join the student
+    columns with ``views.join_students``; each group starts where rank is 1.
+    """
+    eligible = eligible[eligible['department'].notna() & eligible['grade'].notna()]
+    if len(eligible) == 0:
+        return pd.DataFrame({'row': pd.Series(dtype='int64'), 'rank': pd.Series(dtype='int64')})
+    
+    dept_codes, _ = pd.factorize(eligible['department'], sort=True)
+    grade_codes, _ = pd.factorize(eligible['grade'], sort=True)
+    
+    # np.lexsort sorts by the last key first and is stable
+    order = np.lexsort((
+        -eligible[RANK_KEYS[2]].to_numpy(dtype=float),
+        -eligible[RANK_KEYS[1]].to_numpy(dtype=float),
+        -eligible[RANK_KEYS[0]].to_numpy(dtype=float),
+        grade_codes,
+        dept_codes,
+    ))
+    
+    return pd.DataFrame({
+        'row': eligible.index.to_numpy()[order],
+        'rank': group_ranks(dept_codes[order], grade_codes[order])
+    })
+
+
+def group_ranks(*sorted_keys):
+    """1-based position of each row within its run of equal keys"""
+    changed = np.zeros(len(sorted_keys[0]), dtype=bool)
+    for keys in sorted_keys:
+        changed[1:] |= keys[1:] != keys[:-1]
+    changed[:1] = True
+    group_starts = np.flatnonzero(changed)
+    group_sizes = np.diff(np.append(group_starts, len(changed)))
+    return (np.arange(len(changed)) - np.repeat(group_starts, group_sizes) + 1).astype('int64')
@@ -0,0 +1,219 @@
+"""Result summaries and the text report"""
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+REPORT_TYPES = [
+    "전체 종합 보고서",
+    "단과대학별 보고서",
+    "장학 종류별 보고서",
+    "학과별 상세 보고서"
+]
+
+
+def summarize_recipients(results):
+    """Recipient count and total amount per college and scholarship type"""
+    summary = results.groupby(['college', 'scholarship_type'], observed=True).agg({
+        'student_id': 'count',
+        'scholarship_amount': 'sum'
+    }).reset_index()
+    summary.columns = ['단과대학', '장학종류', '선정인원', '총장학금']
+    return summary
+
+
+def detailed_analytics(results):
+    """Recipient statistics per college, department and scholarship type"""
+    analytics = results.groupby(['college', 'department', 'scholarship_type'], observed=True).agg({
+        'student_id': 'count',
+        'scholarship_amount': ['sum', 'mean'],
+        'prev_semester_gpa': ['mean', 'min', 'max']
+    }).round(2)
+    
+    analytics.columns = ['선정인원', '총장학금', '평균장학금', '평균GPA', '최저GPA', '최고GPA']
+    return analytics.reset_index()
+
+
+def recipient_pivot(results, value='선정인원'):
+    """College × scholarship type pivot of recipient counts or amounts, with totals"""
+    return summarize_recipients(results).pivot_table(
+        index='단과대학',
+        columns='장학종류',
+        values=value,
+        aggfunc='sum',
+        fill_value=0,
+        margins=True,
+        margins_name='합계',
+        observed=True
+    ).reset_index()
+
+
+def workbook_sheets(rankings=None, college_quotas=None, dept_quotas=None, recipients=None):
+    """Sheets of the finance workbook, skipping stages that have no results yet"""
+    sheets = {}
+    if rankings is not None and not rankings.empty:
+        sheets['순위'] = rankings
+    if college_quotas is not None and not college_quotas.empty:
+        sheets['단과대학 TO'] = college_quotas
+    if dept_quotas is not None and not dept_quotas.empty:
+        sheets['학과 TO'] = dept_quotas
+    if recipients is not None and not recipients.empty:
+        sheets['선정자'] = recipients
+        sheets['요약'] = summarize_recipients(recipients)
+        sheets['인원 피벗'] = recipient_pivot(recipients, '선정인원')
+        sheets['장학금 피벗'] = recipient_pivot(recipients, '총장학금')
+    return sheets
+
+
+def _type_section(results):
+    """Per scholarship type counts, budget and mean GPA, in order of first appearance"""
+    stats = results.groupby('scholarship_type', sort=False, observed=True).agg(
+        count=('student_id', 'size'),
+        amount=('scholarship_amount', 'sum'),
+        gpa=('prev_semester_gpa', 'mean')
+    )
+    lines = ["🏆 장학 종류별 현황", "-" * 30]
+    for scholarship_type, row in zip(stats.index, stats.itertuples(index=False)):
+        lines.append(f"• {scholarship_type}")
+        lines.append(f"  - 선정 인원: {row.count}명")
+        lines.append(f"  - 총 예산: {row.amount:,}원")
+        lines.append(f"  - 평균 GPA: {row.gpa:.2f}")
+    lines.append("")
+    return lines
+
+
+def _type_counts(results, keys):
+    """Recipients per ``keys`` group and scholarship type, most common type first"""
+    counts = results.groupby(keys + ['scholarship_type'], sort=False, observed=True).size()
+    counts = counts.reset_index(name='count')
+    counts['_seen'] = np.arange(len(counts))
+    counts = counts.sort_values(keys + ['count', '_seen'], ascending=[True] * len(keys) + [False, True])
+    return {
+        group: list(zip(part['scholarship_type'], part['count']))
+        for group, part in counts.groupby(keys if len(keys) > 1 else keys[0], sort=False, observed=True)
+    }
+
+
+def _college_section(results):
+    """Per college counts and budget with the scholarship type distribution"""
+    stats = results.groupby('college', sort=True, observed=True).agg(
+        count=('student_id', 'size'),
+        amount=('scholarship_amount', 'sum')
+    )
+    distribution = _type_counts(results, ['college'])
+    lines = ["🏫 단과대학별 현황", "-" * 30]
+    for college, row in zip(stats.index, stats.itertuples(index=False)):
+        lines.append(f"• {college}")
+        lines.append(f"  - 선정 인원: {row.count}명")
+        lines.append(f"  - 총 예산: {row.amount:,}원")
+        for scholarship_type, count in distribution[college]:
+            lines.append(f"    └ {scholarship_type}: {count}명")
+    lines.append("")
+    return lines
+
+
+def _department_section(results):
+    """Per department counts, budget, mean GPA and type distribution, grouped by college"""
+    stats = results.groupby(['college', 'department'], sort=True, observed=True).agg(
+        count=('student_id', 'size'),
+        amount=('scholarship_amount', 'sum'),
+        gpa=('prev_semester_gpa', 'mean')
+    )
+    distribution = _type_counts(results, ['college', 'department'])
+    lines = ["🏛 학과별 상세 현황", "-" * 30]
+    current_college = None
+    for (college, department), row in zip(stats.index, stats.itertuples(index=False)):
+        if college != current_college:
+            lines.append(f"[{college}]")
+            current_college = college
+        lines.append(f"• {department}")
+        lines.append(f"  - 선정 인원: {row.count}명")
+        lines.append(f"  - 총 예산: {row.amount:,}원")
+        lines.append(f"  - 평균 GPA: {row.gpa:.2f}")
+        for scholarship_type, count in distribution[(college, department)]:
+            lines.append(f"    └ {scholarship_type}: {count}명")
+    lines.append("")
+    return lines
+
+
+def _recipient_lines(rows):
+    """Format recipient rows as report lines without a per-row Python loop"""
+    gpa = pd.Series(np.char.mod('%.2f', rows['prev_semester_gpa'].to_numpy(dtype=float)), index=rows.index)
+    lines = (
+        "• " + rows['student_id'].astype(str) + " " + rows['name'].astype(str)
+        + " (" + rows['department'].astype(str) + " " + rows['grade'].astype(str) + "학년) - "
+        + rows['scholarship_type'].astype(str) + " (GPA: " + gpa + ")"
+    )
+    return lines.tolist()
+
+
+def iter_text_report(results, report_type=REPORT_TYPES[0], include_individual=True, chunk_size=50000):
+    """Yield the plain-text selection report in pieces
+
+    Joining the pieces gives the whole report; the recipient list is
+    formatted ``chunk_size`` rows at a time so large result sets never
+    have to be held as one string.
+    """
+    if report_type not in REPORT_TYPES:
+        raise ValueError(f"Unknown report type: {report_type}")
+    
+    title = "성적 우수 장학금 선정 결과 보고서"
+    if report_type != REPORT_TYPES[0]:
+        title += f" ({report_type})"
+    lines = [
+        "=" * 60,
+        title,
+        f"생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}",
+        "=" * 60,
+        "",
+        "📊 전체 현황",
+        "-" * 30,
+        f"• 총 선정 인원: {len(results):,}명",
+        f"• 총 장학 예산: {results['scholarship_amount'].sum():,}원",
+        f"• 참여 단과대학: {results['college'].nunique()}개",
+        f"• 참여 학과: {results['department'].nunique()}개",
+        f"• 평균 GPA: {results['prev_semester_gpa'].mean():.2f}",
+        ""
+    ]
+    
+    if report_type in (REPORT_TYPES[0], "장학 종류별 보고서"):
+        lines += _type_section(results)
+    if report_type in (REPORT_TYPES[0], "단과대학별 보고서"):
+        lines += _college_section(results)
+    if report_type == "학과별 상세 보고서":
+        lines += _department_section(results)
+    
+    if not include_individual:
+        yield "\n".join(lines)
+        return
+    
+    lines += ["👥 선정자 명단", "-" * 30]
+    yield "\n".join(lines) + "\n"
+    if results.empty:
+        return
+    
+    # One sort of the key columns; each college is then a contiguous run of rows
+    keys = results[['college', 'department', 'grade', 'rank']].reset_index(drop=True)
+    order = keys.sort_values(['college', 'department', 'grade', 'rank'], kind='stable').index.to_numpy()
+    colleges = keys['college'].to_numpy()[order]
+    starts = np.flatnonzero(np.r_[True, colleges[1:] != colleges[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    for start, end in zip(starts, ends):
+        yield f"\n[{colleges[start]}]\n"
+        for chunk_start in range(start, end, chunk_size):
+            rows = results.take(order[chunk_start:min(chunk_start + chunk_size, end)])
+            yield "\n".join(_recipient_lines(rows)) + "\n"
+
+
+def build_text_report(results, report_type=REPORT_TYPES[0], include_individual=True):
+    """Build the plain-text scholarship selection report as one string"""
+    return "".join(iter_text_report(results, report_type, include_individual))
+
+
+def write_text_report(results, path, report_type=REPORT_TYPES[0], include_individual=True):
+    """Stream the text report to ``path`` and return its size in bytes"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for piece in iter_text_report(results, report_type, include_individual):
+            f.write(piece)
+    return os.path.getsize(path)
@@ -0,0 +1,72 @@
+"""Synthetic student data for demos and load tests"""
+import numpy as np
+import pandas as pd
+
+
+def generate_sample_data(n_students=150, seed=42):
+    """Generate comprehensive sample student data
+
+    Every column is drawn as a whole array from a seeded ``np.random.Generator``
+    so that large load-test datasets (millions of rows) can be built quickly.
+    """
+    rng = np.random.default_rng(seed)
+    
+    colleges = ['공과대학', '경영대학', '인문대학', '자연과학대학', '사회과학대학']
+    departments = {
+        '공과대학': ['컴퓨터공학과', '기계공학과', '전자공학과', '건축학과'],
+        '경영대학': ['경영학과', '회계학과', '국제경영학과', '마케팅학과'],
+        '인문대학': ['국어국문학과', '영어영문학과', '사학과', '철학과'],
+        '자연과학대학': ['수학과', '물리학과', '화학과', '생물학과'],
+        '사회과학대학': ['사회학과', '정치외교학과', '심리학과', '경제학과']
+    }
+    
+    admission_types = ['일반전형', '학생부종합전형', '특별전형', '정시전형', '수시전형']
+    admission_categories = ['신입학', '편입학', '재입학']
+    change_types = ['전과', '복수전공', '부전공']
+    
+    # Departments are drawn uniformly within the drawn college
+    college_idx = rng.integers(0, len(colleges), n_students)
+    dept_counts = np.array([len(departments[c]) for c in colleges])
+    dept_offsets = np.concatenate([[0], np.cumsum(dept_counts)[:-1]])
+    dept_idx = dept_offsets[college_idx] + (rng.random(n_students) * dept_counts[college_idx]).astype(np.int64)
+    all_departments = np.array([d for c in colleges for d in departments[c]], dtype=object)
+    
+    grade = rng.choice([1, 2, 3, 4], size=n_students, p=[0.3, 0.3, 0.25, 0.15])
+    
+    # Generate realistic GPA based on grade (higher grades tend to have higher GPAs)
+    base_gpa = 3.0 + (grade * 0.1) + rng.normal(0, 0.4, n_students)
+    
+    # student_id is "202{grade}{serial:04d}", built as an integer and formatted once
+    serial = np.arange(n_students)
+    serial_digits = np.maximum(4, np.searchsorted(10 ** np.arange(1, 19), serial, side='right') + 1)
+    student_id = ((2020 + grade) * 10 ** serial_digits + serial).astype(str).astype(object)
+    name = ("학생" + pd.Series(serial + 1).astype(str).str.zfill(3)).to_numpy(dtype=object)
+    
+    # Add some academic record changes (20% chance of having academic changes)
+    has_change = rng.random(n_students) < 0.2
+    change_month = rng.integers(3, 12, n_students)
+    change_day = rng.integers(1, 28, n_students)
+    date_table = np.array([f"2023-{m:02d}-{d:02d}" for m in range(3, 12) for d in range(1, 28)], dtype=object)
+    change_date = date_table[(change_month - 3) * 27 + (change_day - 1)]
+    change_type = np.array(change_types, dtype=object)[rng.integers(0, len(change_types), n_students)]
+    change_date[~has_change] = None
+    change_type[~has_change] = None
+    
+    return pd.DataFrame({
+        'student_id': student_id,
+        'name': name,
+        'college': np.array(colleges, dtype=object)[college_idx],
+        'department': all_departments[dept_idx],
+        'grade': grade,
+        'student_type': '정규과정',
+        'admission_type': np.array(admission_types, dtype=object)[rng.integers(0, len(admission_types), n_students)],
+        'admission_category': rng.choice(np.array(admission_categories, dtype=object), size=n_students, p=[0.8, 0.15, 0.05]),
+        'prev_semester_gpa': np.clip(base_gpa, 0.0, 4.5),
+        'prev_semester_credits': rng.integers(15, 22, n_students),
+        'prev_semester_major_credits': rng.integers(6, 15, n_students),
+        'academic_status': rng.choice(np.array(['재학', '휴학', '제적'], dtype=object), size=n_students, p=[0.85, 0.12, 0.03]),
+        'total_credits': grade * 35 + rng.integers(-10, 20, n_students),
+        'entrance_year': 2024 - grade + rng.choice([-1, 0, 1], size=n_students, p=[0.1, 0.8, 0.1]),
+        'academic_change_date': change_date,
+        'academic_change_type': change_type
+    })
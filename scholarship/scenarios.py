@@ -0,0 +1,174 @@
+"""What-if scenario sweeps over budget, scholarship amounts and eligibility thresholds
+
+Each scenario reruns the TO calculation and the assignment on top of one
+shared ranking. The ranking is computed once at the loosest thresholds in
+the grid; a stricter scenario only drops rows and renumbers ranks, which
+gives exactly what ``compute_rankings`` would on the stricter eligible set.
+Scenarios are evaluated in a process pool. The shared frames are written
+once as a checkpoint (see ``checkpoint``) that every worker memory-maps at
+start-up, so they are neither pickled per worker nor copied per scenario.
+Workers are never forked from the caller, which may be the multithreaded
+Streamlit server: they come from a forkserver (or are spawned).
+"""
+import itertools
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .assignment import DEFAULT_SCHOLARSHIP_AMOUNTS, assign_scholarships
+from .checkpoint import load_frame, save_frame
+from .eligibility import filter_eligible
+from .quota import calculate_quotas
+from .ranking import compute_rankings, group_ranks
+from .views import student_columns
+
+# Frames shared by every scenario in a worker process, set by _init_worker
+_shared = {}
+
+
+def scenario_grid(budgets, amounts=None, min_gpas=(2.0,), min_credits=(12,)):
+    """Every combination of the given budgets, per-type amounts and thresholds
+
+    ``amounts`` maps each scholarship type to the amounts to try, e.g.
+    ``{'율곡장학': [5000000, 4500000]}``; types left out keep their default.
+    """
+    amounts = {
+        scholarship_type: list((amounts or {}).get(scholarship_type, [default]))
+        for scholarship_type, default in DEFAULT_SCHOLARSHIP_AMOUNTS.items()
+    }
+    scenarios = []
+    for budget, amount_values, min_gpa, min_credit in itertools.product(
+        budgets, itertools.product(*amounts.values()), min_gpas, min_credits
+    ):
+        scenarios.append({
+            'total_budget': budget,
+            'scholarship_amounts': dict(zip(amounts, amount_values)),
+            'min_gpa': min_gpa,
+            'min_credits': min_credit
+        })
+    return scenarios
+
+
+def restrict_ranking(ranking, students, min_gpa, min_credits):
+    """Ranking of the rows meeting stricter thresholds, renumbered within each group"""
+    scores = student_columns(ranking, students, ['prev_semester_gpa', 'prev_semester_credits'])
+    mask = (
+        (scores['prev_semester_gpa'] >= min_gpa) &
+        (scores['prev_semester_credits'] >= min_credits)
+    ).to_numpy()
+    if mask.all():
+        return ranking
+    # Groups are the runs between rank-1 rows of the full ranking
+    groups = np.cumsum(ranking['rank'].to_numpy() == 1)[mask]
+    restricted = ranking[mask].reset_index(drop=True)
+    if restricted.empty:
+        return restricted
+    restricted['rank'] = group_ranks(groups)
+    return restricted
+
+
+def _pool_context():
+    """A start method that does not fork the calling (possibly multithreaded) process
+
+    The forkserver forks workers from its own single-threaded process, with
+    the engine imported once in advance; spawn is the fallback elsewhere.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+def _init_worker(directory):
+    _shared['ranking'] = load_frame(os.path.join(directory, 'ranking'))
+    _shared['students'] = load_frame(os.path.join(directory, 'students'))
+
+
+def evaluate_scenario(scenario, ranking=None, students=None):
+    """Run TO calculation and assignment for one scenario and summarize the outcome"""
+    if ranking is None:
+        ranking = _shared['ranking']
+        students = _shared['students']
+    amounts = scenario['scholarship_amounts']
+    
+    quotas = calculate_quotas(students, scenario['total_budget'], amounts)
+    recipients = assign_scholarships(
+        restrict_ranking(ranking, students, scenario['min_gpa'], scenario['min_credits']),
+        quotas,
+        students,
+        scholarship_amounts=amounts
+    )
+    
+    row = {
+        '총예산': scenario['total_budget'],
+        **{f'{scholarship_type}금액': amount for scholarship_type, amount in amounts.items()},
+        '최소GPA': scenario['min_gpa'],
+        '최소학점': scenario['min_credits'],
+        'TO': sum(sum(data['quotas'].values()) for data in quotas.values()),
+        'TO예산': int(sum(data['budget'] for data in quotas.values())),
+        '선정인원': len(recipients),
+        '집행예산': int(recipients['scholarship_amount'].sum()) if not recipients.empty else 0
+    }
+    row['예산집행률'] = row['집행예산'] / scenario['total_budget'] if scenario['total_budget'] else 0.0
+    if not recipients.empty:
+        row.update({
+            f'{scholarship_type}인원': int(count)
+            for scholarship_type, count in recipients['scholarship_type'].value_counts(sort=False).items()
+        })
+        colleges = student_columns(recipients, students, 'college')
+        row.update({
+            f'{college} 선정': int(count)
+            for college, count in colleges.groupby('college', observed=True).size().items()
+        })
+    return row
+
+
+def run_scenarios(students, scenarios, exclude_inactive=True, max_workers=None):
+    """Evaluate ``scenarios`` (see ``scenario_grid``) and return a comparison table
+
+    One row per scenario, in input order: the scenario parameters, recipient
+    count, spend, spend ratio, recipients per type and per college.
+    """
+    if not scenarios:
+        return pd.DataFrame()
+    
+    ranking = compute_rankings(filter_eligible(
+        students,
+        min_gpa=min(s['min_gpa'] for s in scenarios),
+        min_credits=min(s['min_credits'] for s in scenarios),
+        exclude_inactive=exclude_inactive
+    ))
+    # Columns read by the quota calculation, the assignment and restrict_ranking
+    students = students[[
+        'college', 'department', 'grade', 'academic_status',
+        'prev_semester_gpa', 'prev_semester_credits'
+    ]]
+    
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(scenarios))
+    
+    if max_workers <= 1:
+        rows = [evaluate_scenario(scenario, ranking, students) for scenario in scenarios]
+    else:
+        with tempfile.TemporaryDirectory(prefix='scholarship_scenarios_') as directory:
+            save_frame(os.path.join(directory, 'ranking'), ranking)
+            save_frame(os.path.join(directory, 'students'), students)
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=_pool_context(),
+                initializer=_init_worker,
+                initargs=(directory,)
+            ) as pool:
+                rows = list(pool.map(evaluate_scenario, scenarios))
+    
+    comparison = pd.DataFrame(rows)
+    count_columns = [col for col in comparison.columns if col.endswith('인원') or col.endswith(' 선정')]
+    comparison[count_columns] = comparison[count_columns].fillna(0).astype('int64')
+    comparison.insert(0, '시나리오', np.arange(1, len(comparison) + 1))
+    return comparison
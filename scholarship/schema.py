@@ -0,0 +1,269 @@
+"""Student table schema, compact in-memory dtypes and validated CSV ingestion"""
+import csv
+import io
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORY_COLUMNS = [
+    'college',
+    'department',
+    'admission_type',
+    'admission_category',
+    'academic_status',
+    'student_type'
+]
+
+# Whole-number columns downcast to the smallest integer type that fits.
+# prev_semester_gpa stays float64 so slider thresholds compare exactly.
+INTEGER_COLUMNS = [
+    'grade',
+    'prev_semester_credits',
+    'prev_semester_major_credits',
+    'total_credits',
+    'entrance_year'
+]
+
+
+def normalize_students(df):
+    """Return a copy of ``df`` with categorical text columns and downcast integers
+
+    Categories are kept in sorted order so that sorting and grouping give the
+    same order as on plain strings. Integer columns containing missing values
+    are left untouched. Student IDs become strings whatever the file format
+    parsed them as, so lookups by typed-in ID match every source. The index
+    is reset to 0..n-1: thin results refer to students by index label (the
+    ``row`` column), which needs unique labels that mean the same in the
+    store and the checkpoints.
+    """
+    df = df.copy()
+    df.index = pd.RangeIndex(len(df))
+    if 'student_id' in df.columns and not pd.api.types.is_string_dtype(df['student_id'].dtype):
+        df['student_id'] = df['student_id'].astype('str')
+    for col in CATEGORY_COLUMNS:
+        if col not in df.columns:
+            continue
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            categories = df[col].cat.categories
+            if not categories.is_monotonic_increasing:
+                df[col] = df[col].cat.reorder_categories(categories.sort_values())
+        else:
+            df[col] = df[col].astype('category')
+    for col in INTEGER_COLUMNS:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col].dtype):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def memory_report(before, after):
+    """Per-column deep memory usage of two versions of the same frame"""
+    before_bytes = before.memory_usage(index=False, deep=True)
+    after_bytes = after.memory_usage(index=False, deep=True)
+    report = pd.DataFrame({
+        'column': before_bytes.index,
+        'dtype_before': [str(before[c].dtype) for c in before_bytes.index],
+        'dtype_after': [str(after[c].dtype) for c in before_bytes.index],
+        'bytes_before': before_bytes.to_numpy(),
+        'bytes_after': after_bytes.reindex(before_bytes.index).to_numpy()
+    })
+    total = pd.DataFrame([{
+        'column': '합계',
+        'dtype_before': '',
+        'dtype_after': '',
+        'bytes_before': int(report['bytes_before'].sum()),
+        'bytes_after': int(report['bytes_after'].sum())
+    }])
+    return pd.concat([report, total], ignore_index=True)
+
+
+# Columns of the CSV template; every upload must provide them
+REQUIRED_COLUMNS = [
+    'student_id',
+    'name',
+    'college',
+    'department',
+    'grade',
+    'student_type',
+    'admission_type',
+    'admission_category',
+    'prev_semester_gpa',
+    'prev_semester_credits',
+    'prev_semester_major_credits',
+    'academic_status'
+]
+
+# Columns read when present (the sample data generator produces them)
+OPTIONAL_COLUMNS = [
+    'total_credits',
+    'entrance_year',
+    'academic_change_date',
+    'academic_change_type'
+]
+
+NUMERIC_COLUMNS = ['prev_semester_gpa'] + INTEGER_COLUMNS
+
+GPA_RANGE = (0.0, 4.5)
+GRADE_RANGE = (1, 4)
+
+
+class SchemaError(ValueError):
+    """Raised when a student file is missing required columns"""
+
+
+def _validate_chunk(chunk):
+    """Convert numeric columns of a raw chunk and return (values, rejection reasons)
+
+    The reason is an empty string for valid rows, otherwise the first failed
+    check for that row.
+    """
+    values = chunk.copy()
+    for col in NUMERIC_COLUMNS:
+        if col in values.columns:
+            values[col] = pd.to_numeric(values[col], errors='coerce')
+    
+    gpa = values['prev_semester_gpa']
+    grade = values['grade']
+    checks = [
+        (chunk[REQUIRED_COLUMNS].isna().any(axis=1), "필수값 누락"),
+        (gpa.isna() | (gpa < GPA_RANGE[0]) | (gpa > GPA_RANGE[1]), "GPA 범위 오류 (0~4.5)"),
+        (grade.isna() | (grade < GRADE_RANGE[0]) | (grade > GRADE_RANGE[1]) | (grade % 1 != 0), "학년 범위 오류 (1~4)")
+    ]
+    for col in ['prev_semester_credits', 'prev_semester_major_credits']:
+        credits = values[col]
+        checks.append((credits.isna() | (credits < 0) | (credits % 1 != 0), f"학점 오류 ({col} ≥ 0)"))
+    
+    reasons = pd.Series('', index=chunk.index, dtype=object)
+    for mask, reason in reversed(checks):
+        reasons[mask.to_numpy()] = reason
+    return values, reasons
+
+
+def _field_counts(source):
+    """Number of fields in every record of a CSV file, header first
+
+    Blank (or whitespace-only) lines are left out, as the parser skips them.
+    Quoted fields may span lines, so this tokenizes the file instead of
+    counting separators.
+    """
+    source.seek(0)
+    text = io.TextIOWrapper(source, encoding='utf-8-sig', newline='')
+    try:
+        counts = np.fromiter(
+            (len(fields) if len(fields) > 1 or (fields and fields[0].strip()) else 0
+             for fields in csv.reader(text)),
+            dtype=np.int64
+        )
+    finally:
+        # Hand the binary file back to the caller instead of closing it
+        text.detach()
+    source.seek(0)
+    return counts[counts > 0]
+
+
+def read_students_csv(source, chunksize=100000, on_progress=None, max_errors=10000):
+    """Stream a student CSV in chunks, validating each chunk against the schema
+
+    Only template columns (plus known optional ones) are read, text columns are
+    parsed straight into categoricals and chunks are validated as they arrive,
+    so peak memory is the accepted rows plus one chunk (or one column while the
+    chunks are combined). Rows failing a check are collected into an error
+    report (at most ``max_errors`` rows are kept in it). Rows with more or
+    fewer fields than the header are rejected before any check: their
+    values would land in the wrong columns.
+
+    ``source`` is a path or a seekable binary file object.
+    ``on_progress(rows_read, fraction)`` is called after every chunk.
+
+    Returns ``(students, error_report, rejected_count)``.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return read_students_csv(f, chunksize, on_progress, max_errors)
+    
+    source.seek(0)
+    header = pd.read_csv(source, nrows=0, encoding='utf-8-sig').columns
+    missing = [c for c in REQUIRED_COLUMNS if c not in header]
+    if missing:
+        raise SchemaError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+    
+    usecols = [c for c in REQUIRED_COLUMNS + OPTIONAL_COLUMNS if c in header]
+    dtype = {c: ('category' if c in CATEGORY_COLUMNS else str) for c in usecols}
+    
+    # The parser pads short rows and, with usecols, silently drops extra fields
+    # inside the used range, so field counts are checked on the raw records.
+    # Naming spare columns up to the widest row keeps one parsed row per record.
+    field_counts = _field_counts(source)[1:]
+    names = list(header) + [f'_extra_{i}' for i in range(max(field_counts.max(initial=0) - len(header), 0))]
+    
+    total_size = source.seek(0, 2)
+    source.seek(0)
+    
+    accepted = []
+    rejected = []
+    rejected_count = 0
+    rows_read = 0
+    
+    reader = pd.read_csv(
+        source,
+        header=0,
+        names=names,
+        usecols=usecols,
+        dtype=dtype,
+        encoding='utf-8-sig',
+        chunksize=chunksize
+    )
+    for chunk in reader:
+        chunk.index = pd.RangeIndex(rows_read + 1, rows_read + len(chunk) + 1)
+        wrong_fields = field_counts[rows_read:rows_read + len(chunk)] != len(header)
+        rows_read += len(chunk)
+        
+        values, reasons = _validate_chunk(chunk)
+        reasons[wrong_fields] = "필드 수 오류"
+        invalid = (reasons != '').to_numpy()
+        accepted.append(values[~invalid])
+        
+        if invalid.any():
+            rejected_count += int(invalid.sum())
+            room = max_errors - sum(len(r) for r in rejected)
+            if room > 0:
+                bad = chunk[invalid].head(room).astype(object)
+                bad.insert(0, '오류 사유', reasons[invalid].head(room))
+                bad.insert(0, '데이터 행', bad.index)
+                rejected.append(bad)
+        
+        if on_progress is not None:
+            on_progress(rows_read, min(source.tell() / total_size, 1.0) if total_size else None)
+    
+    students = _concat_chunks(accepted, usecols)
+    error_report = pd.concat(rejected, ignore_index=True) if rejected else pd.DataFrame(columns=['데이터 행', '오류 사유'])
+    return students, error_report, rejected_count
+
+
+def _concat_chunks(chunks, columns):
+    """Concatenate validated chunks, unioning categoricals and narrowing integers
+
+    Each column is dropped from the chunks once it has been combined, so only
+    one column exists twice at a time. Categories that only occurred in
+    rejected rows are removed.
+    """
+    chunks = [c for c in chunks if len(c)] or chunks[:1]
+    if not chunks:
+        return pd.DataFrame(columns=columns)
+    
+    data = {}
+    for col in columns:
+        parts = [c[col] for c in chunks]
+        for c in chunks:
+            del c[col]
+        if col in CATEGORY_COLUMNS:
+            combined = union_categoricals([p.array for p in parts], sort_categories=True)
+            data[col] = pd.Series(combined).cat.remove_unused_categories()
+        else:
+            data[col] = pd.concat(parts, ignore_index=True)
+        del parts
+        if col in INTEGER_COLUMNS and not data[col].isna().any():
+            data[col] = pd.to_numeric(data[col].astype('int64'), downcast='integer')
+    return pd.DataFrame(data)
@@ -0,0 +1,236 @@
+"""Optional persistent store for the student data and stage results (SQLite, WAL)
+
+One database file backs any number of app sessions and survives restarts:
+students, rankings, quotas and assignments are kept as indexed tables next
+to a small ``meta`` table with the keys they were computed under. Every
+save bumps ``version``, so a session can tell with one query whether
+another one has saved newer data.
+"""
+import json
+import sqlite3
+from contextlib import contextmanager
+
+import pandas as pd
+
+from .schema import normalize_students
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS rankings (
+    seq INTEGER PRIMARY KEY,
+    "row" INTEGER NOT NULL,
+    "rank" INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rankings_row ON rankings ("row");
+CREATE TABLE IF NOT EXISTS quotas (
+    college TEXT NOT NULL,
+    scholarship_type TEXT NOT NULL,
+    quota INTEGER NOT NULL,
+    enrollment INTEGER NOT NULL,
+    ratio REAL NOT NULL,
+    budget INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (college, scholarship_type)
+);
+CREATE TABLE IF NOT EXISTS assignments (
+    seq INTEGER PRIMARY KEY,
+    "row" INTEGER NOT NULL,
+    "rank" INTEGER NOT NULL,
+    scholarship_type TEXT NOT NULL,
+    scholarship_amount INTEGER NOT NULL,
+    assignment_date TEXT,
+    assignment_semester TEXT
+);
+CREATE INDEX IF NOT EXISTS assignments_row ON assignments ("row");
+CREATE INDEX IF NOT EXISTS assignments_type ON assignments (scholarship_type);
+"""
+
+# Indexes on the students table, which is recreated with the uploaded file's columns
+STUDENT_INDEXES = [('student_id',), ('college', 'department', 'grade')]
+
+META_KEYS = ['students_fingerprint', 'ranking_key', 'ranking_params', 'quota_key', 'assignment_key']
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_type(dtype):
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(dtype):
+        return 'REAL'
+    return 'TEXT'
+
+
+def _records(df):
+    """Rows of ``df`` as tuples of plain Python values, None for missing"""
+    columns = [df[col].astype(object).where(df[col].notna(), None).tolist() for col in df.columns]
+    return zip(*columns)
+
+
+class SQLiteStore:
+    """Students, rankings, quotas and assignments in one SQLite file
+
+    Each call opens its own connection, so one store can be shared between
+    Streamlit's script threads; WAL mode lets readers run while one
+    session writes. Every save replaces its table in a single transaction.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+    
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute('PRAGMA synchronous=NORMAL')
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def _set_meta(self, conn, **values):
+        """Store ``values`` and bump the version, inside the caller's transaction"""
+        version = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        values['version'] = (json.loads(version[0]) if version else 0) + 1
+        conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in values.items()]
+        )
+    
+    def meta(self):
+        """Keys of the stored results and the store version (0 when nothing was saved)"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT key, value FROM meta").fetchall()
+        meta = dict.fromkeys(META_KEYS)
+        meta['version'] = 0
+        meta.update((key, json.loads(value)) for key, value in rows)
+        return meta
+    
+    def version(self):
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return json.loads(row[0]) if row else 0
+    
+    def save_students(self, students, fingerprint):
+        """Replace the students table; the frame's index is kept as ``row``"""
+        columns = [_quote('row') + ' INTEGER PRIMARY KEY'] + [
+            f"{_quote(col)} {_sql_type(dtype)}" for col, dtype in students.dtypes.items()
+        ]
+        placeholders = ', '.join(['?'] * (len(students.columns) + 1))
+        rows = students.reset_index(names='row')
+        with self._connect() as conn:
+            conn.execute("DROP TABLE IF EXISTS students")
+            conn.execute(f"CREATE TABLE students ({', '.join(columns)})")
+            conn.executemany(f"INSERT INTO students VALUES ({placeholders})", _records(rows))
+            for index_columns in STUDENT_INDEXES:
+                if all(col in students.columns for col in index_columns):
+                    conn.execute(
+                        f"CREATE INDEX {_quote('students_' + '_'.join(index_columns))} "
+                        f"ON students ({', '.join(map(_quote, index_columns))})"
+                    )
+            self._set_meta(conn, students_fingerprint=fingerprint)
+    
+    def load_students(self):
+        """The stored students with compact dtypes, or None if nothing was saved"""
+        with self._connect() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'students'"
+            ).fetchone()
+            if not exists:
+                return None
+            students = pd.read_sql_query('SELECT * FROM students ORDER BY "row"', conn, index_col='row')
+        students.index.name = None
+        return normalize_students(students)
+    
+    def query_students(self, columns=None, **filters):
+        """Students matching every ``column=value`` filter, via the table's indexes"""
+        select = '*' if columns is None else ', '.join(map(_quote, ['row'] + list(columns)))
+        where = ' AND '.join(f"{_quote(col)} = ?" for col in filters) or '1'
+        with self._connect() as conn:
+            return pd.read_sql_query(
+                f'SELECT {select} FROM students WHERE {where} ORDER BY "row"',
+                conn, params=list(filters.values()), index_col='row'
+            ).rename_axis(None)
+    
+    def save_rankings(self, ranking, key, params=None):
+        """Replace the stored ranking (a thin frame, or None to clear it)"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM rankings")
+            if ranking is not None:
+                conn.executemany(
+                    'INSERT INTO rankings (seq, "row", "rank") VALUES (?, ?, ?)',
+                    _records(ranking[['row', 'rank']].reset_index(drop=True).reset_index())
+                )
+            self._set_meta(conn, ranking_key=key, ranking_params=params)
+    
+    def load_rankings(self):
+        with self._connect() as conn:
+            return pd.read_sql_query('SELECT "row", "rank" FROM rankings ORDER BY seq', conn)
+    
+    def save_quotas(self, quota_results, key):
+        """Replace the stored TO (``calculate_quotas`` output, or None to clear it)"""
+        rows = []
+        for college, data in (quota_results or {}).items():
+            for scholarship_type, quota in data['quotas'].items():
+                rows.append((
+                    college, scholarship_type, int(quota), int(data['enrollment']),
+                    float(data['ratio']), int(data['budget']), len(rows)
+                ))
+        # The budget and amounts the TO was bought with are the same for every college
+        first = next(iter(quota_results.values())) if quota_results else {}
+        with self._connect() as conn:
+            conn.execute("DELETE FROM quotas")
+            conn.executemany("INSERT INTO quotas VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._set_meta(
+                conn, quota_key=key,
+                quota_budget=first.get('total_budget'), quota_amounts=first.get('amounts')
+            )
+    
+    def load_quotas(self):
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT college, scholarship_type, quota, enrollment, ratio, budget FROM quotas ORDER BY seq"
+            ).fetchall()
+            params = dict(conn.execute(
+                "SELECT key, value FROM meta WHERE key IN ('quota_budget', 'quota_amounts')"
+            ).fetchall())
+        total_budget = json.loads(params.get('quota_budget', 'null'))
+        amounts = json.loads(params.get('quota_amounts', 'null'))
+        quota_results = {}
+        for college, scholarship_type, quota, enrollment, ratio, budget in rows:
+            data = quota_results.setdefault(college, {
+                'enrollment': enrollment, 'ratio': ratio, 'budget': budget,
+                'total_budget': total_budget, 'amounts': amounts, 'quotas': {}
+            })
+            data['quotas'][scholarship_type] = quota
+        return quota_results
+    
+    def save_assignments(self, assignments, key):
+        """Replace the stored assignment (a thin frame, or None to clear it)"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM assignments")
+            if assignments is not None and not assignments.empty:
+                columns = ['row', 'rank', 'scholarship_type', 'scholarship_amount',
+                           'assignment_date', 'assignment_semester']
+                conn.executemany(
+                    "INSERT INTO assignments VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    _records(assignments[columns].reset_index(drop=True).reset_index())
+                )
+            self._set_meta(conn, assignment_key=key)
+    
+    def load_assignments(self):
+        with self._connect() as conn:
+            assignments = pd.read_sql_query(
+                'SELECT "row", "rank", scholarship_type, scholarship_amount, assignment_date, '
+                'assignment_semester FROM assignments ORDER BY seq',
+                conn
+            )
+        return assignments if not assignments.empty else pd.DataFrame()
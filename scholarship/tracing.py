@@ -0,0 +1,116 @@
+"""Lightweight per-stage tracing of script runs
+
+A ``Tracer`` keeps the last few runs (a Streamlit rerun, a CLI invocation),
+each with the wall time, output row count and memory delta of every stage
+that ran inside it. Memory is the change in resident set size, or in traced
+allocations while ``tracemalloc`` is active; both are cheap enough to leave
+on permanently.
+"""
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = None
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None where /proc is not available"""
+    if _PAGE_SIZE is None:
+        return None
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        return None
+
+
+class Span:
+    """One timed stage; set ``rows`` inside the ``with`` block to record the output size"""
+    
+    def __init__(self, name):
+        self.name = name
+        self.rows = None
+        self.seconds = None
+        self.rss_delta = None
+        self.traced_delta = None
+    
+    def to_dict(self):
+        return {
+            'stage': self.name,
+            'seconds': self.seconds,
+            'rows': self.rows,
+            'rss_delta_bytes': self.rss_delta,
+            'traced_delta_bytes': self.traced_delta
+        }
+
+
+class Tracer:
+    """Structured trace of the last ``max_runs`` runs"""
+    
+    def __init__(self, max_runs=50):
+        self.runs = deque(maxlen=max_runs)
+        self._current = None
+        self._lock = threading.Lock()
+        self._run_count = 0
+    
+    def begin_run(self, label=None):
+        """Start a new run; a run that never reached ``end_run`` is kept as unfinished"""
+        with self._lock:
+            self._run_count += 1
+            self._current = {
+                'run': self._run_count,
+                'label': label,
+                'started': datetime.now().isoformat(timespec='seconds'),
+                'seconds': None,
+                'stages': [],
+                '_t0': time.perf_counter()
+            }
+            self.runs.append(self._current)
+    
+    def end_run(self, label=None):
+        """Record the total wall time of the current run"""
+        with self._lock:
+            if self._current is not None:
+                if label is not None:
+                    self._current['label'] = label
+                self._current['seconds'] = time.perf_counter() - self._current.pop('_t0')
+                self._current = None
+    
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block and append it to the current (or latest) run"""
+        span = Span(name)
+        rss_before = current_rss()
+        traced_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.seconds = time.perf_counter() - started
+            rss_after = current_rss()
+            if rss_before is not None and rss_after is not None:
+                span.rss_delta = rss_after - rss_before
+            if traced_before is not None and tracemalloc.is_tracing():
+                span.traced_delta = tracemalloc.get_traced_memory()[0] - traced_before
+            with self._lock:
+                run = self._current or (self.runs[-1] if self.runs else None)
+                if run is not None:
+                    run['stages'].append(span.to_dict())
+    
+    def completed_runs(self, last=None):
+        """Finished runs, oldest first, optionally only the ``last`` ones"""
+        with self._lock:
+            runs = [dict(run) for run in self.runs if run['seconds'] is not None]
+        return runs[-last:] if last else runs
+    
+    def to_json(self):
+        """All recorded runs as a JSON document"""
+        return json.dumps({'runs': self.completed_runs()}, ensure_ascii=False, indent=2)
@@ -0,0 +1,37 @@
+"""Student attributes joined onto thin stage results
+
+Rankings and assignments only hold ``row`` (the student's index label in
+the frame they were computed from) and the columns the stage adds, such as
+``rank`` or ``scholarship_type``. Tables, reports and exports join the
+student columns they need here, when they need them.
+"""
+import pandas as pd
+
+
+def student_positions(results, students):
+    """Row positions in ``students`` of each result row"""
+    positions = students.index.get_indexer(results['row'])
+    if (positions < 0).any():
+        raise KeyError("Results refer to rows that are not in the student frame")
+    return positions
+
+
+def student_columns(results, students, columns):
+    """``columns`` of ``students`` aligned with the result rows (no result columns)"""
+    if isinstance(columns, str):
+        columns = [columns]
+    positions = student_positions(results, students)
+    joined = students.iloc[positions, students.columns.get_indexer(columns)]
+    return joined.reset_index(drop=True)
+
+
+def join_students(results, students, columns=None):
+    """Student attributes (all, or only ``columns``) followed by the result columns
+
+    Returns a new frame with one row per result row; ``row`` itself is dropped.
+    """
+    if columns is None:
+        columns = list(students.columns)
+    own = results.drop(columns='row').reset_index(drop=True)
+    joined = student_columns(results, students, [c for c in columns if c not in own.columns])
+    return pd.concat([joined, own], axis=1)
@@ -0,0 +1,7 @@
+"""Streamlit front end of the scholarship engine
+
+``app.py`` only draws the frame (header, menu, sidebar status) and imports
+the selected page from ``scholarship_app.pages`` when it is first shown.
+Session state and shared resources live in ``state``, reusable widgets in
+``widgets``; the computations themselves are in the ``scholarship`` package.
+"""
@@ -0,0 +1,31 @@
+"""One module per menu entry, each with a ``render()`` function
+
+A page module is imported the first time its menu entry is selected, so a
+rerun only loads and runs the page on screen.
+"""
+import importlib
+
+# Menu label → page module in this package, in menu order
+PAGES = {
+    "🏠 홈": 'home',
+    "👥 학생 데이터 관리": 'students',
+    "📊 성적 순위 산출": 'ranking',
+    "💰 예산 및 TO 관리": 'quota',
+    "🏆 장학생 선정": 'selection',
+    "📈 결과 보고서": 'report'
+}
+
+# Session frames each page reads; the rest may be spilled to disk between reruns
+PAGE_FRAMES = {
+    "🏠 홈": ['students_data'],
+    "👥 학생 데이터 관리": ['students_data', 'memory_report'],
+    "📊 성적 순위 산출": ['students_data', 'ranking_results'],
+    "💰 예산 및 TO 관리": ['students_data', 'scenario_results'],
+    "🏆 장학생 선정": ['students_data', 'ranking_results', 'scholarship_results'],
+    "📈 결과 보고서": ['students_data', 'ranking_results', 'scholarship_results']
+}
+
+
+def render(label):
+    """Import the page for menu entry ``label`` (once per process) and draw it"""
+    importlib.import_module(f"{__name__}.{PAGES[label]}").render()
@@ -0,0 +1,60 @@
+"""🏠 홈: what the system does and the order of the steps"""
+import streamlit as st
+
+
+def render():
+    st.header("시스템 개요")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("""
+        ### 📋 주요 기능
+        
+        **1. 학생 데이터 관리**
+        - 정규과정 학부생 자격 검증
+        - 기본 정보 및 입학 정보 관리
+        - 학적 변동 이력 추적
+        
+        **2. 성적 순위 산출 (FUR-004)**
+        - 직전 학기 평점평균 기준 순위 계산
+        - 동점자 처리 (취득학점, 전공학점 순)
+        - 학과별 순위 산정
+        
+        **3. 예산 및 TO 관리 (FUR-005)**
+        - 부서별 장학 예산 입력 및 관리
+        - 단과대학별 예산 배분
+        - 장학금 종류별 TO 산출
+        
+        **4. 장학생 선정 (FUR-006)**
+        - 순위와 TO를 결합한 대상자 선정
+        - 장학 데이터 생성 및 배정
+        - 자동 고지서 반영 준비
+        """)
+    
+    with col2:
+        st.markdown("""
+        ### 📊 시스템 현황
+        """)
+        
+        if not st.session_state.students_data.empty:
+            st.metric("등록된 학생", len(st.session_state.students_data), "명")
+            st.metric("단과대학", st.session_state.students_data['college'].nunique(), "개")
+            
+            if not st.session_state.scholarship_results.empty:
+                st.metric("선정된 장학생", len(st.session_state.scholarship_results), "명")
+            else:
+                st.metric("선정된 장학생", 0, "명")
+        else:
+            st.info("아직 데이터가 없습니다.\n학생 데이터 관리에서 데이터를 입력해주세요.")
+    
+    # Quick start guide
+    st.markdown("""
+    ### 🚀 빠른 시작 가이드
+    
+    1. **학생 데이터 관리** → 샘플 데이터 생성 또는 CSV/Parquet 파일 업로드
+    2. **성적 순위 산출** → 자격 요건 설정 후 순위 계산 실행
+    3. **예산 및 TO 관리** → 총 예산 및 장학금 금액 입력 후 TO 계산
+    4. **장학생 선정** → 순위와 TO를 바탕으로 장학생 자동 선정
+    5. **결과 보고서** → 최종 결과 확인 및 CSV 파일 다운로드
+    """)
@@ -0,0 +1,220 @@
+"""💰 예산 및 TO 관리: college TO from the budget, department breakdown and budget scenarios"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from scholarship import (
+    DEFAULT_SCHOLARSHIP_AMOUNTS,
+    calculate_quotas,
+    department_quotas,
+    quota_table,
+    run_scenarios,
+    scenario_grid
+)
+from scholarship.cache import frame_fingerprint, make_key
+from scholarship.export import csv_bytes, parquet_bytes
+
+from scholarship_app.state import get_result_cache
+from scholarship_app.widgets import lazy_download_button
+
+
+def parse_number_list(text, cast):
+    """Parse a comma-separated list of numbers, e.g. '500000000, 450000000'"""
+    return [cast(value.strip().replace('_', '')) for value in text.split(',') if value.strip()]
+
+
+def render():
+    tracer = st.session_state.tracer
+    
+    st.header("💰 성적 우수 장학 TO 산출 (FUR-005)")
+    
+    if st.session_state.students_data.empty:
+        st.warning("⚠️ 먼저 학생 데이터를 입력해주세요.")
+    else:
+        tab1, tab2, tab3 = st.tabs(["예산 설정", "TO 계산 결과", "🔀 시나리오 비교"])
+        
+        with tab1:
+            st.subheader("📊 예산 입력")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                total_budget = st.number_input(
+                    "총 장학 예산 (원)", 
+                    min_value=0, 
+                    value=500000000, 
+                    step=10000000,
+                    format="%d"
+                )
+                st.write(f"입력 예산: {total_budget:,}원")
+            
+            with col2:
+                semester = st.selectbox("적용 학기", ["1학기", "2학기", "연간"])
+                budget_year = st.number_input("예산 연도", min_value=2020, max_value=2030, value=2024)
+            
+            st.subheader("🏆 장학금 종류별 금액 설정")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                yulgok_amount = st.number_input(
+                    "율곡장학금 (원)", 
+                    min_value=0, 
+                    value=5000000, 
+                    step=100000,
+                    help="최우수 학생 대상"
+                )
+            with col2:
+                dasan_amount = st.number_input(
+                    "다산장학금 (원)", 
+                    min_value=0, 
+                    value=3000000, 
+                    step=100000,
+                    help="우수 학생 대상"
+                )
+            with col3:
+                woncheon_amount = st.number_input(
+                    "원천장학금 (원)", 
+                    min_value=0, 
+                    value=2000000, 
+                    step=100000,
+                    help="양호 학생 대상"
+                )
+            
+            if st.button("💰 TO 계산 실행", type="primary"):
+                with st.spinner("TO 계산 중..."):
+                    scholarship_amounts = {
+                        '율곡장학': yulgok_amount,
+                        '다산장학': dasan_amount,
+                        '원천장학': woncheon_amount
+                    }
+                    quota_key = make_key(
+                        'quota', st.session_state.students_fingerprint,
+                        total_budget, tuple(scholarship_amounts.items())
+                    )
+                    with tracer.stage('quota') as span:
+                        budget_allocation = get_result_cache().get_or_compute(quota_key, lambda: calculate_quotas(
+                            st.session_state.students_data,
+                            total_budget,
+                            scholarship_amounts
+                        ))
+                        span.rows = len(budget_allocation)
+                    
+                    if quota_key != st.session_state.quota_key:
+                        if st.session_state.assignment_key:
+                            get_result_cache().spill(st.session_state.assignment_key)
+                        st.session_state.scholarship_results = pd.DataFrame()
+                        st.session_state.assignment_key = None
+                    st.session_state.quota_results = budget_allocation
+                    st.session_state.quota_key = quota_key
+                    st.success("✅ TO 계산이 완료되었습니다!")
+        
+        with tab2:
+            if not st.session_state.quota_results:
+                st.info("먼저 TO 계산을 실행해주세요.")
+            else:
+                st.subheader("📋 단과대학별 예산 배정 결과")
+                
+                # Create budget summary table
+                budget_df = quota_table(st.session_state.quota_results)
+                scholarship_types = list(next(iter(st.session_state.quota_results.values()))['quotas'])
+                total_quotas = {
+                    scholarship_type: int(budget_df[f'{scholarship_type}TO'].sum())
+                    for scholarship_type in scholarship_types
+                }
+                allocated_budget = budget_df['배정예산'].sum()
+                budget_df['비율'] = budget_df['비율'].apply(lambda x: f"{x:.1%}")
+                budget_df['배정예산'] = budget_df['배정예산'].apply(lambda x: f"{x:,.0f}원")
+                st.dataframe(budget_df, use_container_width=True)
+                
+                # Summary metrics
+                st.subheader("📊 전체 TO 현황")
+                metric_cols = st.columns(len(total_quotas) + 1)
+                
+                for col, (scholarship_type, quota) in zip(metric_cols, total_quotas.items()):
+                    with col:
+                        st.metric(f"{scholarship_type} TO", quota)
+                with metric_cols[-1]:
+                    total_to = sum(total_quotas.values())
+                    st.metric("전체 TO", total_to)
+                # The budget the TO was computed from, not the (possibly edited) input above
+                quota_budget = next(iter(st.session_state.quota_results.values())).get('total_budget')
+                if quota_budget is not None:
+                    st.caption(f"TO 소요 예산: {allocated_budget:,.0f}원 / 총 예산 {quota_budget:,.0f}원")
+                else:
+                    st.caption(f"TO 소요 예산: {allocated_budget:,.0f}원")
+                
+                # Detailed breakdown by department
+                if st.checkbox("학과별 상세 TO 보기"):
+                    st.subheader("학과별 상세 TO 배정")
+                    
+                    with tracer.stage('department_quota') as span:
+                        dept_df = department_quotas(st.session_state.students_data, st.session_state.quota_results)
+                        span.rows = len(dept_df)
+                    st.dataframe(dept_df, use_container_width=True)
+                
+                # Download results
+                col1, col2 = st.columns(2)
+                with col1:
+                    lazy_download_button(
+                        "📥 TO 결과 다운로드",
+                        lambda df=budget_df: csv_bytes(df),
+                        f"quota_results_{datetime.now().strftime('%Y%m%d')}.csv",
+                        "text/csv",
+                        st.session_state.quota_key
+                    )
+                with col2:
+                    # Parquet keeps ratio and budget numeric instead of the formatted display strings
+                    lazy_download_button(
+                        "📥 TO 결과 Parquet",
+                        lambda quotas=st.session_state.quota_results: parquet_bytes(quota_table(quotas)),
+                        f"quota_results_{datetime.now().strftime('%Y%m%d')}.parquet",
+                        "application/octet-stream",
+                        st.session_state.quota_key
+                    )
+        
+        with tab3:
+            st.subheader("🔀 What-if 시나리오 비교")
+            st.write("예산, 장학금액, 자격 기준의 여러 값을 쉼표로 입력하면 모든 조합에 대해 TO 산출과 장학생 선정을 병렬로 실행합니다.")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                budget_grid = st.text_input("총 장학 예산 (원)", "500000000, 450000000", key='scenario_budgets')
+                min_gpa_grid = st.text_input("최소 GPA 기준", "2.0", key='scenario_min_gpas')
+                min_credits_grid = st.text_input("최소 취득 학점", "12", key='scenario_min_credits')
+            with col2:
+                amount_grids = {
+                    scholarship_type: st.text_input(
+                        f"{scholarship_type}금 (원)", f"{amount}", key=f'scenario_{scholarship_type}'
+                    )
+                    for scholarship_type, amount in DEFAULT_SCHOLARSHIP_AMOUNTS.items()
+                }
+            
+            try:
+                scenarios = scenario_grid(
+                    parse_number_list(budget_grid, int),
+                    {t: parse_number_list(text, int) for t, text in amount_grids.items()},
+                    parse_number_list(min_gpa_grid, float),
+                    parse_number_list(min_credits_grid, int)
+                )
+            except ValueError:
+                scenarios = []
+                st.error("숫자 목록을 쉼표로 구분해 입력해주세요.")
+            st.write(f"시나리오 수: {len(scenarios)}개")
+            
+            if st.button("🔀 시나리오 실행", type="primary", disabled=not scenarios):
+                with st.spinner(f"{len(scenarios)}개 시나리오 계산 중..."):
+                    st.session_state.scenario_results = run_scenarios(
+                        st.session_state.students_data, scenarios
+                    )
+            
+            comparison = st.session_state.scenario_results
+            if not comparison.empty:
+                display = comparison.copy()
+                display['예산집행률'] = display['예산집행률'].apply(lambda x: f"{x:.1%}")
+                st.dataframe(display, use_container_width=True)
+                lazy_download_button(
+                    "📥 시나리오 비교표 다운로드",
+                    lambda df=comparison: csv_bytes(df),
+                    f"scenario_comparison_{datetime.now().strftime('%Y%m%d')}.csv",
+                    "text/csv",
+                    frame_fingerprint(comparison)
+                )
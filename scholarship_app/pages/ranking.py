@@ -0,0 +1,233 @@
+"""📊 성적 순위 산출: department/grade rankings and record corrections with partial re-ranking"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from scholarship import apply_student_updates, compute_rankings, filter_eligible, rerank_students
+from scholarship.cache import frame_fingerprint, make_key
+from scholarship.export import csv_bytes, parquet_bytes
+from scholarship.views import join_students
+
+from scholarship_app.state import (
+    get_filter_index,
+    get_result_cache,
+    get_shared_frames,
+    get_store,
+    joined_view
+)
+from scholarship_app.widgets import lazy_download_button, paginated_table
+
+
+def render():
+    tracer = st.session_state.tracer
+    store = get_store()
+    
+    st.header("📊 성적 순위 산출 (FUR-004)")
+    
+    if st.session_state.students_data.empty:
+        st.warning("⚠️ 먼저 학생 데이터를 입력해주세요.")
+    else:
+        tab1, tab2, tab3 = st.tabs(["순위 계산", "결과 확인", "이의신청 정정"])
+        
+        with tab1:
+            st.subheader("자격 요건 설정")
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                min_gpa = st.slider("최소 GPA 기준", 0.0, 4.5, 2.0, 0.1)
+            with col2:
+                min_credits = st.slider("최소 취득 학점", 0, 25, 12, 1)
+            with col3:
+                exclude_inactive = st.checkbox("휴학생/제적생 제외", value=True)
+            
+            if st.button("📊 순위 계산 실행", type="primary"):
+                with st.spinner("순위 계산 중..."):
+                    ranking_key = make_key(
+                        'ranking', st.session_state.students_fingerprint,
+                        min_gpa, min_credits, exclude_inactive
+                    )
+                    
+                    # Filter eligible students and rank them by department and grade
+                    def rank_students():
+                        with tracer.stage('eligibility') as span:
+                            eligible = filter_eligible(
+                                st.session_state.students_data,
+                                min_gpa=min_gpa,
+                                min_credits=min_credits,
+                                exclude_inactive=exclude_inactive
+                            )
+                            span.rows = len(eligible)
+                        with tracer.stage('ranking') as span:
+                            ranked = compute_rankings(eligible)
+                            span.rows = len(ranked)
+                        return ranked
+                    
+                    rankings = get_result_cache().get_or_compute(ranking_key, rank_students)
+                    
+                    if len(rankings) == 0:
+                        st.error("❌ 자격 요건을 만족하는 학생이 없습니다.")
+                    else:
+                        if ranking_key != st.session_state.ranking_key:
+                            # Results for the previous parameters are only needed again if they are chosen again
+                            for superseded in (st.session_state.ranking_key, st.session_state.assignment_key):
+                                if superseded:
+                                    get_result_cache().spill(superseded)
+                            st.session_state.scholarship_results = pd.DataFrame()
+                            st.session_state.assignment_key = None
+                        st.session_state.ranking_results = rankings
+                        st.session_state.ranking_key = ranking_key
+                        st.session_state.ranking_params = {
+                            'min_gpa': min_gpa,
+                            'min_credits': min_credits,
+                            'exclude_inactive': exclude_inactive
+                        }
+                        
+                        st.success(f"✅ 순위 계산 완료! 총 {len(st.session_state.ranking_results)}명 대상")
+                        
+                        # Show summary by department
+                        ranked_students = joined_view(rankings, ranking_key, ['college', 'department', 'grade'])
+                        summary = ranked_students.groupby(['college', 'department', 'grade'], observed=True).size().reset_index(name='student_count')
+                        st.subheader("학과별 대상자 현황")
+                        st.dataframe(summary, use_container_width=True)
+        
+        with tab2:
+            if st.session_state.ranking_results.empty:
+                st.info("먼저 순위 계산을 실행해주세요.")
+            else:
+                st.subheader("순위 계산 결과")
+                
+                # Only the displayed student columns are joined onto the ranking
+                display_cols = ['rank', 'student_id', 'name', 'college', 'department', 'grade',
+                               'prev_semester_gpa', 'prev_semester_credits', 'prev_semester_major_credits']
+                ranking_view = joined_view(
+                    st.session_state.ranking_results, st.session_state.ranking_key, display_cols
+                )
+                
+                # Filter options
+                ranking_index = get_filter_index(
+                    ranking_view,
+                    ['college', 'department', 'grade'],
+                    st.session_state.ranking_key
+                )
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    colleges = ['전체'] + ranking_index.options('college')
+                    filter_college = st.selectbox("단과대학", colleges)
+                with col2:
+                    departments = ['전체'] + ranking_index.options('department', college=filter_college)
+                    filter_dept = st.selectbox("학과", departments)
+                with col3:
+                    grades = ['전체'] + sorted(ranking_index.options('grade'))
+                    filter_grade = st.selectbox("학년", grades)
+                
+                # Apply filters
+                ranking_filters = {'college': filter_college, 'department': filter_dept, 'grade': filter_grade}
+                filtered_rankings = ranking_index.view(ranking_view, **ranking_filters)
+                
+                # Display results
+                paginated_table(
+                    filtered_rankings,
+                    'rankings_table',
+                    (st.session_state.ranking_key, filter_college, filter_dept, filter_grade),
+                    sort_options={
+                        '순위순': (['college', 'department', 'grade', 'rank'], True),
+                        'GPA순': (['prev_semester_gpa'], False),
+                        '학번순': (['student_id'], True)
+                    }
+                )
+                
+                # Download rankings with every student column, joined on click
+                filtered_thin = ranking_index.view(st.session_state.ranking_results, **ranking_filters)
+                students = st.session_state.students_data
+                col1, col2 = st.columns(2)
+                with col1:
+                    lazy_download_button(
+                        "📥 순위 결과 다운로드",
+                        lambda df=filtered_thin, students=students: csv_bytes(join_students(df, students)),
+                        f"ranking_results_{datetime.now().strftime('%Y%m%d')}.csv",
+                        "text/csv",
+                        (st.session_state.ranking_key, filter_college, filter_dept, filter_grade)
+                    )
+                with col2:
+                    lazy_download_button(
+                        "📥 순위 결과 Parquet",
+                        lambda df=filtered_thin, students=students: parquet_bytes(join_students(df, students)),
+                        f"ranking_results_{datetime.now().strftime('%Y%m%d')}.parquet",
+                        "application/octet-stream",
+                        (st.session_state.ranking_key, filter_college, filter_dept, filter_grade)
+                    )
+        
+        with tab3:
+            if st.session_state.ranking_results.empty:
+                st.info("먼저 순위 계산을 실행해주세요.")
+            else:
+                st.subheader("개별 학생 기록 정정")
+                st.caption("정정된 학생이 속한 학과·학년만 다시 계산하여 기존 순위 결과에 반영합니다.")
+                
+                student_id = st.text_input("학번").strip()
+                students = st.session_state.students_data
+                if store is not None and student_id:
+                    record = store.query_students(student_id=student_id)
+                else:
+                    record = students[students['student_id'] == student_id] if student_id else students.iloc[:0]
+                
+                if student_id and record.empty:
+                    st.error("❌ 해당 학번의 학생이 없습니다.")
+                elif not record.empty:
+                    current = record.iloc[0]
+                    st.write(f"**{current['name']}** ({current['college']} {current['department']} {current['grade']}학년)")
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        new_gpa = st.number_input("평점평균", 0.0, 4.5, float(current['prev_semester_gpa']), 0.01)
+                    with col2:
+                        new_credits = st.number_input("취득학점", 0, 30, int(current['prev_semester_credits']))
+                    with col3:
+                        new_major_credits = st.number_input("전공학점", 0, 30, int(current['prev_semester_major_credits']))
+                    with col4:
+                        statuses = list(students['academic_status'].dropna().unique())
+                        new_status = st.selectbox("학적상태", statuses, index=statuses.index(current['academic_status']))
+                    
+                    if st.button("🔁 정정 반영 및 부분 재계산", type="primary"):
+                        updates = pd.DataFrame({
+                            'student_id': [student_id],
+                            'prev_semester_gpa': [new_gpa],
+                            'prev_semester_credits': [new_credits],
+                            'prev_semester_major_credits': [new_major_credits],
+                            'academic_status': [new_status]
+                        })
+                        params = st.session_state.ranking_params
+                        
+                        # The student and ranking frames may be shared with other sessions and
+                        # the cache, so the correction goes into this session's own copies
+                        cache = get_result_cache()
+                        students = students.copy()
+                        apply_student_updates(students, updates)
+                        with tracer.stage('ranking (정정)') as span:
+                            rankings, moved = rerank_students(
+                                st.session_state.ranking_results.copy(),
+                                students,
+                                [student_id],
+                                **params
+                            )
+                            span.rows = len(moved)
+                        
+                        fingerprint = make_key('patched', st.session_state.students_fingerprint, frame_fingerprint(updates))
+                        ranking_key = make_key(
+                            'ranking', fingerprint,
+                            params['min_gpa'], params['min_credits'], params['exclude_inactive']
+                        )
+                        cache.put(ranking_key, rankings)
+                        st.session_state.students_data = get_shared_frames().intern(('students', fingerprint), students)
+                        st.session_state.students_fingerprint = fingerprint
+                        st.session_state.ranking_results = rankings
+                        st.session_state.ranking_key = ranking_key
+                        st.session_state.scholarship_results = pd.DataFrame()
+                        st.session_state.assignment_key = None
+                        if new_status != current['academic_status']:
+                            # Enrollment counts changed, so the TO must be recalculated
+                            st.session_state.quota_results = {}
+                            st.session_state.quota_key = None
+                        
+                        st.success(f"✅ 정정 반영 완료! 순위가 바뀐 학생 {len(moved)}명")
+                        st.dataframe(moved, use_container_width=True)
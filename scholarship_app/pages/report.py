@@ -0,0 +1,268 @@
+"""📈 결과 보고서: summaries, analytics and the report/workbook downloads"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import os
+import itertools
+import tempfile
+from pathlib import Path
+
+from scholarship import (
+    REPORT_TYPES,
+    department_quotas,
+    detailed_analytics,
+    quota_table,
+    summarize_recipients,
+    workbook_sheets,
+    write_text_report
+)
+from scholarship.cache import make_key
+from scholarship.export import csv_bytes, excel_bytes, parquet_bytes
+
+from scholarship_app.state import get_result_cache, joined_view
+from scholarship_app.widgets import lazy_download_button
+
+
+REPORT_PREVIEW_LINES = 200
+
+
+def discard_report_file():
+    """Delete the previously generated report file, if any"""
+    report_file = st.session_state.report_file
+    if report_file is not None and os.path.exists(report_file['path']):
+        os.remove(report_file['path'])
+    st.session_state.report_file = None
+
+
+def render():
+    tracer = st.session_state.tracer
+    
+    st.header("📈 최종 결과 보고서")
+    
+    if st.session_state.scholarship_results.empty:
+        st.warning("⚠️ 먼저 장학생 선정을 완료해주세요.")
+    else:
+        tab1, tab2, tab3 = st.tabs(["📊 종합 현황", "📋 상세 분석", "📁 문서 출력"])
+        
+        with tab1:
+            st.subheader("🎯 전체 현황 대시보드")
+            
+            # Top-level metrics
+            col1, col2, col3, col4, col5 = st.columns(5)
+            
+            results = joined_view(st.session_state.scholarship_results, st.session_state.assignment_key)
+            
+            with col1:
+                st.metric("총 선정자", len(results), "명")
+            with col2:
+                total_budget = results['scholarship_amount'].sum()
+                st.metric("집행 예산", f"{total_budget/100000000:.1f}억원")
+            with col3:
+                avg_gpa = results['prev_semester_gpa'].mean()
+                st.metric("평균 GPA", f"{avg_gpa:.2f}")
+            with col4:
+                colleges = results['college'].nunique()
+                st.metric("참여 대학", f"{colleges}개")
+            with col5:
+                departments = results['department'].nunique()
+                st.metric("참여 학과", f"{departments}개")
+            
+            # Charts and visualizations
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("장학 종류별 분포")
+                scholarship_dist = results['scholarship_type'].value_counts()
+                st.bar_chart(scholarship_dist)
+                
+                # Add percentage
+                for scholarship, count in scholarship_dist.items():
+                    percentage = count / len(results) * 100
+                    st.write(f"• {scholarship}: {count}명 ({percentage:.1f}%)")
+            
+            with col2:
+                st.subheader("단과대학별 선정 현황")
+                college_dist = results['college'].value_counts()
+                st.bar_chart(college_dist)
+                
+                # Show budget by college
+                college_budget = results.groupby('college', observed=True)['scholarship_amount'].sum()
+                st.write("**예산 현황:**")
+                for college, budget in college_budget.items():
+                    st.write(f"• {college}: {budget:,}원")
+            
+            # Grade distribution
+            st.subheader("학년별 선정 분포")
+            grade_scholar = results.groupby(['grade', 'scholarship_type'], observed=True).size().unstack(fill_value=0)
+            st.bar_chart(grade_scholar)
+            
+            # GPA distribution
+            st.subheader("선정자 GPA 분포")
+            gpa_bins = pd.cut(results['prev_semester_gpa'], bins=[0, 3.0, 3.5, 4.0, 4.5], labels=['3.0미만', '3.0-3.5', '3.5-4.0', '4.0이상'])
+            gpa_dist = gpa_bins.value_counts()
+            st.bar_chart(gpa_dist)
+        
+        with tab2:
+            st.subheader("📊 상세 분석")
+            
+            # Department-level analysis
+            st.subheader("학과별 상세 현황")
+            
+            dept_analysis = results.groupby(['college', 'department'], observed=True).agg({
+                'student_id': 'count',
+                'scholarship_amount': ['sum', 'mean'],
+                'prev_semester_gpa': ['mean', 'min', 'max'],
+                'rank': 'mean'
+            }).round(2)
+            
+            dept_analysis.columns = ['선정인원', '총장학금', '평균장학금', '평균GPA', '최저GPA', '최고GPA', '평균순위']
+            dept_analysis = dept_analysis.reset_index()
+            
+            # Format currency columns
+            for col in ['총장학금', '평균장학금']:
+                dept_analysis[col] = dept_analysis[col].apply(lambda x: f"{x:,.0f}원")
+            
+            st.dataframe(dept_analysis, use_container_width=True)
+            
+            # Correlation analysis
+            st.subheader("성과 지표 상관관계")
+            
+            numeric_cols = ['prev_semester_gpa', 'prev_semester_credits', 'prev_semester_major_credits', 'rank', 'scholarship_amount']
+            correlation_data = results[numeric_cols].copy()
+            correlation_matrix = correlation_data.corr()
+            
+            st.write("**주요 상관관계:**")
+            st.write("- GPA와 순위:", f"{correlation_matrix.loc['prev_semester_gpa', 'rank']:.3f}")
+            st.write("- GPA와 장학금액:", f"{correlation_matrix.loc['prev_semester_gpa', 'scholarship_amount']:.3f}")
+            st.write("- 취득학점과 GPA:", f"{correlation_matrix.loc['prev_semester_credits', 'prev_semester_gpa']:.3f}")
+            
+            # Top performers
+            st.subheader("🏆 최우수 선정자 (상위 10명)")
+            top_performers = results.nlargest(10, 'prev_semester_gpa')[
+                ['student_id', 'name', 'college', 'department', 'grade', 'prev_semester_gpa', 'scholarship_type', 'scholarship_amount']
+            ].copy()
+            top_performers['scholarship_amount'] = top_performers['scholarship_amount'].apply(lambda x: f"{x:,}원")
+            st.dataframe(top_performers, use_container_width=True)
+            
+            # Statistics by scholarship type
+            st.subheader("장학 종류별 통계")
+            
+            scholarship_stats = results.groupby('scholarship_type', observed=True).agg({
+                'prev_semester_gpa': ['count', 'mean', 'std', 'min', 'max'],
+                'scholarship_amount': 'sum'
+            }).round(3)
+            
+            scholarship_stats.columns = ['인원', '평균GPA', 'GPA표준편차', '최저GPA', '최고GPA', '총예산']
+            scholarship_stats = scholarship_stats.reset_index()
+            scholarship_stats['총예산'] = scholarship_stats['총예산'].apply(lambda x: f"{x:,}원")
+            
+            st.dataframe(scholarship_stats, use_container_width=True)
+        
+        with tab3:
+            st.subheader("📄 공식 문서 생성")
+            
+            # Generate comprehensive report
+            st.subheader("보고서 생성 옵션")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                report_type = st.selectbox("보고서 유형", REPORT_TYPES)
+            
+            with col2:
+                include_charts = st.checkbox("차트 포함", value=True)
+                include_individual = st.checkbox("개별 학생 명단 포함", value=True)
+            
+            # Report generation (streamed to a temporary file; only a preview is rendered)
+            report_version = (st.session_state.assignment_key, report_type, include_individual)
+            if st.button("📄 보고서 생성", type="primary"):
+                discard_report_file()
+                fd, path = tempfile.mkstemp(prefix='scholarship_report_', suffix='.txt', dir=st.session_state.spill_dir)
+                os.close(fd)
+                with st.spinner("보고서를 생성하는 중..."), tracer.stage('report') as span:
+                    size = write_text_report(results, path, report_type, include_individual)
+                    span.rows = len(results)
+                with open(path, encoding='utf-8') as f:
+                    preview = ''.join(itertools.islice(f, REPORT_PREVIEW_LINES))
+                st.session_state.report_file = {
+                    'path': path,
+                    'size': size,
+                    'preview': preview,
+                    'version': report_version,
+                    'file_name': f"scholarship_report_{datetime.now().strftime('%Y%m%d_%H%M')}.txt"
+                }
+            
+            report_file = st.session_state.report_file
+            if report_file is not None and report_file['version'] == report_version:
+                # Display report
+                st.text_area("생성된 보고서 (미리보기)", report_file['preview'], height=400)
+                st.caption(f"미리보기는 앞부분 {REPORT_PREVIEW_LINES}줄만 표시합니다. 전체 크기: {report_file['size'] / 1024:,.1f} KB")
+                
+                # Download report
+                st.download_button(
+                    "📥 보고서 텍스트 다운로드",
+                    lambda path=report_file['path']: Path(path).read_bytes(),
+                    report_file['file_name'],
+                    "text/plain"
+                )
+            
+            # Finance workbook: every stage in one .xlsx, written row by row
+            st.subheader("Excel 통합 파일")
+            st.caption("순위, 단과대학 TO, 학과 TO, 선정자 명단과 요약 피벗을 시트별로 담습니다.")
+            # The build runs outside the script thread, so it only gets what is bound here
+            quota_results = st.session_state.quota_results
+            ranking_results = st.session_state.ranking_results
+            rankings = joined_view(ranking_results, st.session_state.ranking_key) if not ranking_results.empty else None
+            college_quotas = quota_table(quota_results) if quota_results else None
+            dept_quotas = get_result_cache().get_or_compute(
+                make_key('department_quotas', st.session_state.students_fingerprint, st.session_state.quota_key),
+                lambda: department_quotas(st.session_state.students_data, quota_results)
+            ) if quota_results else None
+            lazy_download_button(
+                "📗 Excel 통합 파일 다운로드",
+                lambda rankings=rankings, college=college_quotas, dept=dept_quotas, df=results: excel_bytes(
+                    workbook_sheets(rankings, college, dept, df)
+                ),
+                f"scholarship_workbook_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                (st.session_state.ranking_key, st.session_state.quota_key, st.session_state.assignment_key)
+            )
+            
+            # Individual downloads
+            st.subheader("개별 데이터 다운로드")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                lazy_download_button(
+                    "📋 전체 선정자 명단",
+                    lambda df=results: csv_bytes(df),
+                    f"all_recipients_{datetime.now().strftime('%Y%m%d')}.csv",
+                    "text/csv",
+                    st.session_state.assignment_key
+                )
+                lazy_download_button(
+                    "📋 전체 선정자 명단 (Parquet)",
+                    lambda df=results: parquet_bytes(df),
+                    f"all_recipients_{datetime.now().strftime('%Y%m%d')}.parquet",
+                    "application/octet-stream",
+                    st.session_state.assignment_key
+                )
+            
+            with col2:
+                lazy_download_button(
+                    "📊 요약 통계",
+                    lambda df=results: csv_bytes(summarize_recipients(df)),
+                    f"summary_stats_{datetime.now().strftime('%Y%m%d')}.csv",
+                    "text/csv",
+                    st.session_state.assignment_key
+                )
+            
+            with col3:
+                # Detailed analytics are aggregated only when downloaded
+                lazy_download_button(
+                    "📈 상세 분석",
+                    lambda df=results: csv_bytes(detailed_analytics(df)),
+                    f"detailed_analysis_{datetime.now().strftime('%Y%m%d')}.csv",
+                    "text/csv",
+                    st.session_state.assignment_key
+                )
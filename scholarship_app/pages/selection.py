@@ -0,0 +1,302 @@
+"""🏆 장학생 선정: assign scholarships by rank, with optional manual adjustments"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from scholarship import (
+    DEFAULT_SCHOLARSHIP_AMOUNTS,
+    adjust_assignments,
+    assign_scholarships,
+    current_semester,
+    quota_amounts,
+    summarize_recipients
+)
+from scholarship.cache import frame_fingerprint, make_key
+from scholarship.export import csv_bytes, parquet_bytes
+from scholarship.filters import search_positions
+
+from scholarship_app.state import NO_OVERRIDES, get_filter_index, get_result_cache, joined_view
+from scholarship_app.widgets import PAGE_SIZES, lazy_download_button, paginated_table
+
+
+# Editor choice that withdraws an award in manual adjustment
+WITHDRAWN = '선정 취소'
+
+
+def adjusted_assignment_key(base_key, overrides):
+    """Version of an automatic assignment after this session's manual changes"""
+    if overrides.empty:
+        return base_key
+    return make_key('assignment_adjusted', base_key, frame_fingerprint(overrides))
+
+
+def render():
+    tracer = st.session_state.tracer
+    
+    st.header("🏆 성적 우수 장학 대상자 선정 (FUR-006)")
+    
+    if st.session_state.ranking_results.empty or not st.session_state.quota_results:
+        st.warning("⚠️ 먼저 순위 산출과 TO 관리를 완료해주세요.")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.session_state.ranking_results.empty:
+                st.error("❌ 순위 계산 미완료")
+            else:
+                st.success("✅ 순위 계산 완료")
+        
+        with col2:
+            if not st.session_state.quota_results:
+                st.error("❌ TO 계산 미완료")
+            else:
+                st.success("✅ TO 계산 완료")
+    
+    else:
+        tab1, tab2 = st.tabs(["장학생 선정", "선정 결과"])
+        
+        with tab1:
+            st.subheader("선정 조건 설정")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                selection_method = st.radio(
+                    "선정 방식",
+                    ["자동 선정 (순위 기준)", "수동 조정 가능"]
+                )
+            
+            with col2:
+                allow_duplicate = st.checkbox("중복 장학 허용", value=False)
+                assignment_semester = st.text_input("배정 학기", current_semester(), help="예: 2024-1, 2024-2")
+            
+            # Preview selection criteria
+            st.info(f"""
+            📋 **선정 기준 요약:**
+            - 선정 방식: {selection_method}
+            - 중복 장학: {'허용' if allow_duplicate else '불허'}
+            - 배정 학기: {assignment_semester}
+            """)
+            
+            if st.button("🏆 장학생 선정 실행", type="primary"):
+                with st.spinner("장학생 선정 중..."):
+                    ranking_data = st.session_state.ranking_results
+                    quota_data = st.session_state.quota_results
+                    
+                    assignment_key = make_key(
+                        'assignment', st.session_state.ranking_key, st.session_state.quota_key,
+                        datetime.now().strftime('%Y-%m-%d'), assignment_semester
+                    )
+                    with tracer.stage('assignment') as span:
+                        scholarship_assignments = get_result_cache().get_or_compute(assignment_key, lambda: assign_scholarships(
+                            ranking_data,
+                            quota_data,
+                            st.session_state.students_data,
+                            scholarship_amounts=quota_amounts(quota_data),
+                            assignment_semester=assignment_semester
+                        ))
+                        span.rows = len(scholarship_assignments)
+                    
+                    if not scholarship_assignments.empty:
+                        if st.session_state.assignment_key not in (None, assignment_key):
+                            get_result_cache().spill(st.session_state.assignment_key)
+                        st.session_state.scholarship_results = scholarship_assignments
+                        st.session_state.assignment_key = assignment_key
+                        st.session_state.assignment_base = scholarship_assignments
+                        st.session_state.assignment_base_key = assignment_key
+                        st.session_state.assignment_overrides = NO_OVERRIDES
+                        st.success(f"✅ 장학생 선정 완료! 총 {len(scholarship_assignments)}명 선정")
+                        
+                        # Show summary
+                        summary_by_type = st.session_state.scholarship_results['scholarship_type'].value_counts()
+                        
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("율곡장학", summary_by_type.get('율곡장학', 0))
+                        with col2:
+                            st.metric("다산장학", summary_by_type.get('다산장학', 0))
+                        with col3:
+                            st.metric("원천장학", summary_by_type.get('원천장학', 0))
+                    else:
+                        st.error("❌ 선정된 장학생이 없습니다. 조건을 확인해주세요.")
+            
+            # Manual mode: this session's changes on top of the (shared) automatic result
+            base_key = st.session_state.assignment_base_key
+            overrides = st.session_state.assignment_overrides
+            if selection_method == "수동 조정 가능" and base_key is not None and (
+                st.session_state.assignment_key == adjusted_assignment_key(base_key, overrides)
+            ):
+                st.subheader("✏️ 수동 조정")
+                st.caption(
+                    f"장학 종류를 바꾸거나 '{WITHDRAWN}'를 고른 뒤 반영하면 이 세션의 결과에만 적용됩니다. "
+                    "반영은 현재 페이지의 변경분에 적용되며, 다른 페이지의 조정은 유지됩니다."
+                )
+                base = st.session_state.assignment_base
+                editor_frame = joined_view(base, base_key, ['student_id', 'name', 'college', 'department', 'grade'])
+                
+                # Like the other tables, only one page of recipients is sent to the editor
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    search = st.text_input("🔍 검색 (학번/이름)", key='manual_search').strip()
+                with col2:
+                    page_size = st.selectbox("페이지 크기", PAGE_SIZES, key='manual_page_size')
+                positions = get_result_cache().get_or_compute(
+                    make_key('table_order', base_key, search),
+                    lambda: search_positions(editor_frame, ('student_id', 'name'), search)
+                )
+                n_pages = max(1, -(-len(positions) // page_size))
+                if st.session_state.get('manual_page', 1) > n_pages:
+                    st.session_state['manual_page'] = 1
+                page = st.number_input(
+                    f"페이지 (총 {n_pages:,}쪽)", min_value=1, max_value=n_pages, step=1, key='manual_page'
+                )
+                window = positions[(page - 1) * page_size:page * page_size]
+                page_base = base.take(window)
+                page_rows = page_base['row'].to_numpy()
+                
+                current_types = pd.Series(page_base['scholarship_type'].to_numpy(dtype=object), index=page_rows)
+                current_types.update(overrides.set_index('row')['scholarship_type'].fillna(WITHDRAWN))
+                page_frame = editor_frame.take(window)
+                edited = st.data_editor(
+                    page_frame.assign(rank=page_base['rank'].to_numpy(), scholarship_type=current_types.to_numpy()),
+                    column_config={
+                        'scholarship_type': st.column_config.SelectboxColumn(
+                            "장학 종류", options=list(DEFAULT_SCHOLARSHIP_AMOUNTS) + [WITHDRAWN], required=True
+                        )
+                    },
+                    disabled=list(page_frame.columns) + ['rank'],
+                    hide_index=True,
+                    key=f"manual_editor_{base_key}_{search}_{page_size}_{page}"
+                )
+                
+                if st.button("✅ 수동 조정 반영"):
+                    chosen = edited['scholarship_type'].to_numpy(dtype=object)
+                    changed = chosen != page_base['scholarship_type'].to_numpy(dtype=object)
+                    overrides = pd.concat([
+                        overrides[~overrides['row'].isin(page_rows)],
+                        pd.DataFrame({
+                            'row': page_rows[changed],
+                            'scholarship_type': [None if t == WITHDRAWN else t for t in chosen[changed]]
+                        })
+                    ]).sort_values('row', ignore_index=True)
+                    st.session_state.assignment_overrides = overrides
+                    st.session_state.scholarship_results = adjust_assignments(
+                        base, overrides, quota_amounts(st.session_state.quota_results)
+                    )
+                    st.session_state.assignment_key = adjusted_assignment_key(base_key, overrides)
+                    st.success(f"✅ 수동 조정 {len(overrides)}건 반영 (총 {len(st.session_state.scholarship_results)}명 선정)")
+        
+        with tab2:
+            if st.session_state.scholarship_results.empty:
+                st.info("먼저 장학생 선정을 실행해주세요.")
+            else:
+                st.subheader("🎉 장학생 선정 결과")
+                recipients = joined_view(st.session_state.scholarship_results, st.session_state.assignment_key)
+                
+                # Summary metrics
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("총 선정자", len(recipients))
+                
+                with col2:
+                    total_amount = recipients['scholarship_amount'].sum()
+                    st.metric("총 장학금", f"{total_amount:,}원")
+                
+                with col3:
+                    colleges_count = recipients['college'].nunique()
+                    st.metric("참여 단과대학", f"{colleges_count}개")
+                
+                with col4:
+                    avg_gpa = recipients['prev_semester_gpa'].mean()
+                    st.metric("평균 GPA", f"{avg_gpa:.2f}")
+                
+                # Detailed results by scholarship type
+                st.subheader("장학 종류별 현황")
+                scholarship_summary = summarize_recipients(recipients)
+                scholarship_summary['총장학금'] = scholarship_summary['총장학금'].apply(lambda x: f"{x:,}원")
+                
+                pivot_summary = scholarship_summary.pivot_table(
+                    index='단과대학', 
+                    columns='장학종류', 
+                    values='선정인원', 
+                    fill_value=0,
+                    observed=True
+                )
+                st.dataframe(pivot_summary, use_container_width=True)
+                
+                # Detailed student list
+                st.subheader("선정자 명단")
+                
+                # Filters for detailed view
+                result_index = get_filter_index(
+                    recipients,
+                    ['college', 'scholarship_type'],
+                    st.session_state.assignment_key
+                )
+                col1, col2 = st.columns(2)
+                with col1:
+                    filter_college = st.selectbox(
+                        "단과대학 필터", 
+                        ['전체'] + result_index.options('college')
+                    )
+                with col2:
+                    filter_scholarship = st.selectbox(
+                        "장학 종류 필터",
+                        ['전체'] + result_index.options('scholarship_type')
+                    )
+                
+                # Apply filters
+                filtered_results = result_index.view(
+                    recipients,
+                    college=filter_college,
+                    scholarship_type=filter_scholarship
+                )
+                
+                # Display results (sorted, searched and paged on the server)
+                display_columns = [
+                    'rank', 'student_id', 'name', 'college', 'department', 'grade',
+                    'prev_semester_gpa', 'scholarship_type', 'scholarship_amount', 'assignment_date'
+                ]
+                
+                order, view_version = paginated_table(
+                    filtered_results,
+                    'results_table',
+                    (st.session_state.assignment_key, filter_college, filter_scholarship),
+                    columns=display_columns,
+                    sort_options={
+                        '순위순': (['college', 'department', 'grade', 'rank'], True),
+                        'GPA순': (['prev_semester_gpa'], False),
+                        '학과순': (['college', 'department', 'name'], True),
+                        '학번순': (['student_id'], True)
+                    },
+                    formatters={'scholarship_amount': lambda x: f"{x:,}원"}
+                )
+                
+                # Download buttons
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    lazy_download_button(
+                        "📥 선정자 명단 다운로드",
+                        lambda df=filtered_results, order=order: csv_bytes(df.take(order)),
+                        f"scholarship_recipients_{datetime.now().strftime('%Y%m%d')}.csv",
+                        "text/csv",
+                        view_version
+                    )
+                
+                with col2:
+                    lazy_download_button(
+                        "📥 선정자 명단 Parquet",
+                        lambda df=filtered_results, order=order: parquet_bytes(df.take(order)),
+                        f"scholarship_recipients_{datetime.now().strftime('%Y%m%d')}.parquet",
+                        "application/octet-stream",
+                        view_version
+                    )
+                
+                with col3:
+                    # Create summary report
+                    lazy_download_button(
+                        "📊 요약 보고서 다운로드",
+                        lambda df=scholarship_summary: csv_bytes(df),
+                        f"scholarship_summary_{datetime.now().strftime('%Y%m%d')}.csv",
+                        "text/csv",
+                        st.session_state.assignment_key
+                    )
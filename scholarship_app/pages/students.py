@@ -0,0 +1,262 @@
+"""👥 학생 데이터 관리: upload or generate students, browse them and check eligibility"""
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from scholarship import STUDENT_FILE_TYPES, check_eligibility, generate_sample_data, load_students
+from scholarship.export import csv_bytes
+from scholarship.schema import read_students_csv
+
+from scholarship_app.state import get_filter_index, set_students_data
+from scholarship_app.widgets import lazy_download_button, paginated_table
+
+
+def render():
+    tracer = st.session_state.tracer
+    
+    st.header("📋 학생 데이터 관리")
+    
+    tab1, tab2, tab3 = st.tabs(["데이터 입력", "데이터 확인", "자격 요건 검증"])
+    
+    with tab1:
+        st.subheader("데이터 입력 방식 선택")
+        
+        data_option = st.radio("입력 방식", ["🔄 샘플 데이터 생성", "📁 파일 업로드"])
+        
+        if data_option == "🔄 샘플 데이터 생성":
+            col1, col2 = st.columns([1, 2])
+            
+            with col1:
+                n_students = st.number_input(
+                    "생성할 학생 수",
+                    min_value=10,
+                    max_value=5000000,
+                    value=150,
+                    step=1000,
+                    help="부하 테스트용으로 최대 500만 명까지 생성할 수 있습니다."
+                )
+                seed = st.number_input("난수 시드", min_value=0, value=42, step=1)
+                
+                if st.button("샘플 데이터 생성", type="primary"):
+                    with st.spinner("데이터 생성 중..."):
+                        with tracer.stage('ingest') as span:
+                            set_students_data(generate_sample_data(int(n_students), int(seed)))
+                            span.rows = len(st.session_state.students_data)
+                    st.success("✅ 샘플 데이터 생성 완료!")
+            
+            with col2:
+                st.info(f"🔍 샘플 데이터에는 {int(n_students):,}명의 학생 정보가 포함됩니다.")
+        
+        else:
+            uploaded_file = st.file_uploader(
+                "📁 학생 데이터 파일 업로드", 
+                type=STUDENT_FILE_TYPES,
+                help="CSV(UTF-8), Parquet 또는 Arrow IPC/Feather 파일을 업로드할 수 있습니다."
+            )
+            
+            streaming = st.checkbox(
+                "CSV 청크 단위 검증 읽기",
+                value=True,
+                help="대용량 CSV를 나누어 읽으면서 GPA(0~4.5), 학년(1~4), 학점(0 이상) 범위를 검증하고 오류 행은 제외합니다."
+            )
+            
+            if uploaded_file is not None:
+                try:
+                    # Parse each uploaded file once rather than on every rerun
+                    upload_id = (uploaded_file.file_id, streaming)
+                    if upload_id != st.session_state.get('uploaded_file_id'):
+                        with tracer.stage('ingest') as span:
+                            if streaming and uploaded_file.name.lower().endswith('.csv'):
+                                progress = st.progress(0.0, text="CSV 읽는 중...")
+                                students, error_report, rejected_count = read_students_csv(
+                                    uploaded_file,
+                                    on_progress=lambda rows, fraction: progress.progress(fraction, text=f"{rows:,}행 읽는 중...")
+                                )
+                                progress.empty()
+                            else:
+                                students, error_report, rejected_count = load_students(uploaded_file), None, 0
+                            set_students_data(students)
+                            span.rows = len(st.session_state.students_data)
+                        st.session_state.ingest_errors = (error_report, rejected_count)
+                        st.session_state.uploaded_file_id = upload_id
+                    st.success(f"✅ 파일 업로드 완료! ({len(st.session_state.students_data)}명)")
+                    
+                    error_report, rejected_count = st.session_state.ingest_errors
+                    if rejected_count:
+                        st.warning(f"⚠️ 검증에 실패하여 제외된 행: {rejected_count:,}개")
+                        st.dataframe(error_report.head(1000), use_container_width=True)
+                        lazy_download_button(
+                            "📥 오류 행 보고서 다운로드",
+                            lambda df=error_report: csv_bytes(df),
+                            f"rejected_rows_{datetime.now().strftime('%Y%m%d')}.csv",
+                            "text/csv",
+                            upload_id
+                        )
+                except Exception as e:
+                    st.error(f"❌ 파일 읽기 오류: {str(e)}")
+        
+        # CSV 템플릿 다운로드
+        if st.button("📥 CSV 템플릿 다운로드"):
+            template_data = {
+                'student_id': ['20211001', '20211002'],
+                'name': ['홍길동', '김철수'],
+                'college': ['공과대학', '경영대학'],
+                'department': ['컴퓨터공학과', '경영학과'],
+                'grade': [2, 3],
+                'student_type': ['정규과정', '정규과정'],
+                'admission_type': ['일반전형', '특별전형'],
+                'admission_category': ['신입학', '신입학'],
+                'prev_semester_gpa': [3.75, 3.42],
+                'prev_semester_credits': [18, 19],
+                'prev_semester_major_credits': [12, 9],
+                'academic_status': ['재학', '재학']
+            }
+            template_df = pd.DataFrame(template_data)
+            st.download_button(
+                "CSV 템플릿 다운로드",
+                template_df.to_csv(index=False, encoding='utf-8-sig'),
+                "student_data_template.csv",
+                "text/csv"
+            )
+    
+    with tab2:
+        if st.session_state.students_data.empty:
+            st.warning("⚠️ 학생 데이터가 없습니다. 먼저 데이터를 입력해주세요.")
+        else:
+            st.subheader("📊 데이터 현황")
+            
+            # Summary metrics
+            col1, col2, col3, col4, col5 = st.columns(5)
+            
+            with col1:
+                st.metric("총 학생 수", len(st.session_state.students_data))
+            with col2:
+                st.metric("단과대학 수", st.session_state.students_data['college'].nunique())
+            with col3:
+                st.metric("학과 수", st.session_state.students_data['department'].nunique())
+            with col4:
+                avg_gpa = st.session_state.students_data['prev_semester_gpa'].mean()
+                st.metric("평균 GPA", f"{avg_gpa:.2f}")
+            with col5:
+                active_students = len(st.session_state.students_data[
+                    st.session_state.students_data['academic_status'] == '재학'
+                ])
+                st.metric("재학생 수", active_students)
+            
+            if st.session_state.get('memory_report') is not None:
+                with st.expander("💾 메모리 사용량 (컬럼 타입 최적화 전/후)"):
+                    report = st.session_state.memory_report
+                    before, after = report.iloc[-1][['bytes_before', 'bytes_after']]
+                    if before:
+                        st.write(f"{before / 1024 ** 2:,.1f} MB → {after / 1024 ** 2:,.1f} MB ({1 - after / before:.0%} 절감)")
+                    st.dataframe(report, use_container_width=True)
+            
+            # College distribution
+            st.subheader("단과대학별 분포")
+            college_dist = st.session_state.students_data['college'].value_counts()
+            
+            col1, col2 = st.columns([1, 1])
+            with col1:
+                st.bar_chart(college_dist)
+            with col2:
+                st.dataframe(college_dist.reset_index())
+            
+            # Detailed data view
+            st.subheader("상세 데이터")
+            
+            # Filters
+            student_index = get_filter_index(
+                st.session_state.students_data,
+                ['college', 'grade', 'academic_status'],
+                st.session_state.students_fingerprint
+            )
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                colleges = ['전체'] + student_index.options('college')
+                selected_college = st.selectbox("단과대학 필터", colleges)
+            with col2:
+                grades = ['전체'] + sorted(student_index.options('grade'))
+                selected_grade = st.selectbox("학년 필터", grades)
+            with col3:
+                statuses = ['전체'] + student_index.options('academic_status')
+                selected_status = st.selectbox("학적상태 필터", statuses)
+            
+            # Apply filters
+            filtered_data = student_index.view(
+                st.session_state.students_data,
+                college=selected_college,
+                grade=selected_grade,
+                academic_status=selected_status
+            )
+            
+            paginated_table(
+                filtered_data,
+                'students_table',
+                (st.session_state.students_fingerprint, selected_college, selected_grade, selected_status),
+                sort_options={
+                    '기본순': (None, True),
+                    '학번순': (['student_id'], True),
+                    'GPA순': (['prev_semester_gpa'], False),
+                    '학과순': (['college', 'department', 'name'], True)
+                }
+            )
+            
+            # Download filtered data
+            if len(filtered_data) > 0:
+                lazy_download_button(
+                    "📥 필터된 데이터 다운로드",
+                    lambda df=filtered_data: csv_bytes(df),
+                    f"filtered_students_{datetime.now().strftime('%Y%m%d')}.csv",
+                    "text/csv",
+                    (st.session_state.students_fingerprint, selected_college, selected_grade, selected_status)
+                )
+    
+    with tab3:
+        if st.session_state.students_data.empty:
+            st.warning("⚠️ 학생 데이터가 없습니다.")
+        else:
+            st.subheader("자격 요건 검증")
+            
+            # Eligibility criteria
+            col1, col2 = st.columns(2)
+            with col1:
+                min_gpa = st.slider("최소 GPA 기준", 0.0, 4.5, 2.0, 0.1)
+                min_credits = st.slider("최소 취득 학점", 0, 25, 12, 1)
+            
+            with col2:
+                exclude_types = st.multiselect(
+                    "제외할 학생 유형",
+                    ['교환학생', '시간제학생', '방문학생'],
+                    default=['교환학생', '시간제학생', '방문학생']
+                )
+                
+                required_status = st.multiselect(
+                    "허용할 학적 상태",
+                    list(st.session_state.students_data['academic_status'].unique()),
+                    default=['재학']
+                )
+            
+            if st.button("자격 검증 실행", type="primary"):
+                # Apply eligibility criteria
+                with tracer.stage('eligibility') as span:
+                    eligible, ineligible = check_eligibility(
+                        st.session_state.students_data,
+                        min_gpa,
+                        min_credits,
+                        required_status,
+                        exclude_types
+                    )
+                    span.rows = len(eligible)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.success(f"✅ 자격 충족: {len(eligible)}명")
+                    if len(eligible) > 0:
+                        st.dataframe(eligible[['student_id', 'name', 'college', 'department', 
+                                            'grade', 'prev_semester_gpa', 'academic_status']])
+                
+                with col2:
+                    st.error(f"❌ 자격 미달: {len(ineligible)}명")
+                    if len(ineligible) > 0:
+                        st.dataframe(ineligible[['student_id', 'name', 'college', 'department', 
+                                               'grade', 'prev_semester_gpa', 'academic_status']])
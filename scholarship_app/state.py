@@ -0,0 +1,282 @@
+"""Session state, shared resources and the data handoff between pages
+
+Everything here runs inside the Streamlit script thread of one session;
+the ``get_*`` resources are created once per server process and shared.
+"""
+import os
+import tempfile
+
+import pandas as pd
+import streamlit as st
+
+from scholarship.cache import ResultCache, frame_fingerprint, make_key
+from scholarship.checkpoint import Checkpoints
+from scholarship.filters import FilterIndex
+from scholarship.memory import SharedFrames, enforce_budget, restore_frames
+from scholarship.schema import memory_report, normalize_students
+from scholarship.store import SQLiteStore
+from scholarship.tracing import Tracer
+from scholarship.views import join_students
+
+# Manual adjustments: changed recipients only, with None for a withdrawn award
+NO_OVERRIDES = pd.DataFrame({'row': pd.Series(dtype='int64'), 'scholarship_type': pd.Series(dtype=object)})
+
+# Optional SQLite file shared by all sessions; without it everything lives in the session
+STORE_PATH = os.environ.get('SCHOLARSHIP_DB')
+
+# Optional directory with memory-mappable checkpoints of the last data and results
+CHECKPOINT_DIR = os.environ.get('SCHOLARSHIP_CHECKPOINT_DIR')
+
+# Memory budgets: per session (frames in session state) and for the shared result cache
+SESSION_MEMORY_BYTES = int(os.environ.get('SCHOLARSHIP_SESSION_MEMORY_MB', 1024)) * 1024 ** 2
+CACHE_MEMORY_BYTES = int(os.environ.get('SCHOLARSHIP_CACHE_MEMORY_MB', 512)) * 1024 ** 2
+
+
+def init_session():
+    """Fill in the session state entries a new session starts with"""
+    if 'students_data' not in st.session_state:
+        st.session_state.students_data = pd.DataFrame()
+    if 'scholarship_results' not in st.session_state:
+        st.session_state.scholarship_results = pd.DataFrame()
+    if 'ranking_results' not in st.session_state:
+        st.session_state.ranking_results = pd.DataFrame()
+    if 'quota_results' not in st.session_state:
+        st.session_state.quota_results = {}
+    if 'students_fingerprint' not in st.session_state:
+        st.session_state.students_fingerprint = None
+    if 'ranking_key' not in st.session_state:
+        st.session_state.ranking_key = None
+    if 'quota_key' not in st.session_state:
+        st.session_state.quota_key = None
+    if 'assignment_key' not in st.session_state:
+        st.session_state.assignment_key = None
+    if 'report_file' not in st.session_state:
+        st.session_state.report_file = None
+    if 'scenario_results' not in st.session_state:
+        st.session_state.scenario_results = pd.DataFrame()
+    if 'tracer' not in st.session_state:
+        st.session_state.tracer = Tracer(max_runs=50)
+    if 'spill_dir' not in st.session_state:
+        # Spilled frames and report files; the directory is removed once the
+        # session's state is dropped (TemporaryDirectory cleans up when collected)
+        st.session_state.session_dir = tempfile.TemporaryDirectory(prefix='scholarship_session_')
+        st.session_state.spill_dir = st.session_state.session_dir.name
+    if 'assignment_base_key' not in st.session_state:
+        # Automatic assignment the manual adjustments apply to (only a reference; it may be shared)
+        st.session_state.assignment_base = None
+        st.session_state.assignment_base_key = None
+        st.session_state.assignment_overrides = NO_OVERRIDES
+    if 'store_version' not in st.session_state:
+        # Store version and result keys as of this session's last load or save
+        st.session_state.store_version = None
+        st.session_state.store_keys = {}
+    if 'checkpoint_keys' not in st.session_state:
+        # Result keys as of this session's checkpoint restore or last checkpoint save
+        st.session_state.checkpoint_keys = None
+
+
+@st.cache_resource
+def get_result_cache():
+    """Stage results shared by all sessions, keyed by data fingerprint and parameters"""
+    return ResultCache(CACHE_MEMORY_BYTES, spill_dir=tempfile.mkdtemp(prefix='scholarship_cache_'))
+
+
+@st.cache_resource
+def get_shared_frames():
+    """Student datasets shared read-only by every session that loaded the same content"""
+    return SharedFrames()
+
+
+@st.cache_resource
+def get_store():
+    """The persistent store shared by all sessions, or None when SCHOLARSHIP_DB is not set"""
+    return SQLiteStore(STORE_PATH) if STORE_PATH else None
+
+
+@st.cache_resource
+def get_checkpoints():
+    """The checkpoint directory, or None when SCHOLARSHIP_CHECKPOINT_DIR is not set"""
+    return Checkpoints(CHECKPOINT_DIR) if CHECKPOINT_DIR else None
+
+
+def store_keys():
+    """Keys of the session's data and results, as compared against the store"""
+    state = st.session_state
+    return {
+        'students_fingerprint': state.students_fingerprint,
+        'ranking_key': state.ranking_key,
+        'quota_key': state.quota_key,
+        'assignment_key': state.assignment_key
+    }
+
+
+def load_from_store(store):
+    """Take over what other sessions (or an earlier server run) saved since this session last synced"""
+    meta = store.meta()
+    if meta['version'] == st.session_state.store_version:
+        return
+    state = st.session_state
+    if meta['students_fingerprint'] != state.students_fingerprint:
+        students = get_shared_frames().get_or_load(('students', meta['students_fingerprint']), store.load_students)
+        state.students_data = students if students is not None else pd.DataFrame()
+        state.students_fingerprint = meta['students_fingerprint']
+        state.scenario_results = pd.DataFrame()
+    if meta['ranking_key'] != state.ranking_key:
+        state.ranking_results = store.load_rankings() if meta['ranking_key'] else pd.DataFrame()
+        state.ranking_key = meta['ranking_key']
+        state.ranking_params = meta['ranking_params']
+    if meta['quota_key'] != state.quota_key:
+        state.quota_results = store.load_quotas() if meta['quota_key'] else {}
+        state.quota_key = meta['quota_key']
+    if meta['assignment_key'] != state.assignment_key:
+        state.scholarship_results = store.load_assignments() if meta['assignment_key'] else pd.DataFrame()
+        state.assignment_key = meta['assignment_key']
+        # This session's manual changes refer to rows of the replaced result
+        state.assignment_base = state.scholarship_results if meta['assignment_key'] else None
+        state.assignment_base_key = meta['assignment_key']
+        state.assignment_overrides = NO_OVERRIDES
+    state.store_version = meta['version']
+    state.store_keys = store_keys()
+
+
+def save_to_store(store):
+    """Write the data and results this rerun replaced; untouched ones are left as stored"""
+    state = st.session_state
+    current, saved = store_keys(), state.store_keys
+    if current == saved:
+        return
+    restore_frames(state, ['students_data', 'ranking_results', 'scholarship_results'])
+    if current['students_fingerprint'] != saved.get('students_fingerprint') and not state.students_data.empty:
+        store.save_students(state.students_data, state.students_fingerprint)
+    if current['ranking_key'] != saved.get('ranking_key'):
+        store.save_rankings(
+            state.ranking_results if state.ranking_key else None,
+            state.ranking_key,
+            state.get('ranking_params')
+        )
+    if current['quota_key'] != saved.get('quota_key'):
+        store.save_quotas(state.quota_results if state.quota_key else None, state.quota_key)
+    if current['assignment_key'] != saved.get('assignment_key'):
+        store.save_assignments(state.scholarship_results if state.assignment_key else None, state.assignment_key)
+    state.store_version = store.version()
+    state.store_keys = current
+
+
+def restore_checkpoints(checkpoints, frames):
+    """Resume a new session from the last checkpoint without parsing any file
+
+    Students are mapped right away (and shared with other sessions); the
+    ranking and assignment stay on disk until a page needs them, except for
+    the current page's ``frames``.
+    """
+    meta = checkpoints.meta()
+    state = st.session_state
+    fingerprint = meta['students_fingerprint']
+    students = get_shared_frames().get_or_load(('students', fingerprint), checkpoints.load_students) if fingerprint else None
+    if students is not None:
+        state.students_data = students
+        state.students_fingerprint = fingerprint
+        ranking = checkpoints.frame('rankings')
+        if meta['ranking_key'] and ranking is not None:
+            state.ranking_results = ranking
+            state.ranking_key = meta['ranking_key']
+            state.ranking_params = meta['ranking_params']
+        if meta['quota_key']:
+            state.quota_results = meta['quota_results']
+            state.quota_key = meta['quota_key']
+        assignments = checkpoints.frame('assignments')
+        if meta['assignment_key'] and assignments is not None:
+            state.scholarship_results = assignments
+            state.assignment_key = meta['assignment_key']
+    state.checkpoint_keys = store_keys()
+    restore_frames(state, frames)
+
+
+def save_checkpoints(checkpoints):
+    """Checkpoint the data and results this rerun replaced"""
+    state = st.session_state
+    current, saved = store_keys(), state.checkpoint_keys or {}
+    if current == saved:
+        return
+    restore_frames(state, ['students_data', 'ranking_results', 'scholarship_results'])
+    if current['students_fingerprint'] != saved.get('students_fingerprint') and not state.students_data.empty:
+        checkpoints.save_students(state.students_data, state.students_fingerprint)
+    if current['ranking_key'] != saved.get('ranking_key'):
+        checkpoints.save_rankings(
+            state.ranking_results if state.ranking_key else None,
+            state.ranking_key,
+            state.get('ranking_params')
+        )
+    if current['quota_key'] != saved.get('quota_key'):
+        checkpoints.save_quotas(state.quota_results if state.quota_key else None, state.quota_key)
+    if current['assignment_key'] != saved.get('assignment_key'):
+        checkpoints.save_assignments(
+            state.scholarship_results if state.assignment_key else None,
+            state.assignment_key
+        )
+    state.checkpoint_keys = current
+
+
+def set_students_data(df):
+    """Replace the student dataset and drop results derived from a different one
+
+    The frame is converted to compact dtypes first; the before/after memory
+    usage is kept for the 데이터 확인 tab. Sessions loading the same content
+    share one read-only frame.
+    """
+    compact = normalize_students(df)
+    st.session_state.memory_report = memory_report(df, compact)
+    fingerprint = frame_fingerprint(compact)
+    df = get_shared_frames().intern(('students', fingerprint), compact)
+    if fingerprint != st.session_state.students_fingerprint:
+        st.session_state.ranking_results = pd.DataFrame()
+        st.session_state.quota_results = {}
+        st.session_state.scholarship_results = pd.DataFrame()
+        st.session_state.scenario_results = pd.DataFrame()
+        st.session_state.ranking_key = None
+        st.session_state.quota_key = None
+        st.session_state.assignment_key = None
+    st.session_state.students_data = df
+    st.session_state.students_fingerprint = fingerprint
+
+
+def get_filter_index(df, columns, version):
+    """Value → row-position index for the filter selectboxes, built once per data version"""
+    return get_result_cache().get_or_compute(
+        make_key('filter_index', version, tuple(columns)),
+        lambda: FilterIndex(df, columns)
+    )
+
+
+def joined_view(results, version, columns=None):
+    """Student columns (all, or ``columns``) joined onto thin ``results``, cached per version
+
+    Session state only keeps the thin ranking and assignment frames; the
+    wide tables they are shown as live in the result cache, which may evict them.
+    """
+    students = st.session_state.students_data
+    return get_result_cache().get_or_compute(
+        make_key('joined_view', version, st.session_state.students_fingerprint, tuple(columns or ())),
+        lambda: join_students(results, students, columns)
+    )
+
+
+def keep_within_budget(frames, keep):
+    """Spill ``frames`` outside ``keep`` if the session is over its memory budget
+
+    Measuring the session takes longer than the rest of a typical rerun, so
+    it is skipped while the session holds the same frames as at the last check.
+    """
+    state = st.session_state
+    if session_frames() == state.get('budget_frames'):
+        return
+    enforce_budget(
+        state, SESSION_MEMORY_BYTES, state.spill_dir, frames=frames, keep=keep,
+        shared=(get_result_cache(), get_shared_frames())
+    )
+    state.budget_frames = session_frames()
+
+
+def session_frames():
+    """Identity of every DataFrame in the session state"""
+    return {key: id(value) for key, value in st.session_state.items() if isinstance(value, pd.DataFrame)}
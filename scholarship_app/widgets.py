@@ -0,0 +1,141 @@
+"""Tables, download buttons and sidebar panels used by several pages"""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from scholarship.cache import make_key
+from scholarship.filters import order_positions, search_positions
+from scholarship.memory import owned_bytes, session_memory
+
+from scholarship_app.state import SESSION_MEMORY_BYTES, get_result_cache, get_shared_frames
+
+
+PAGE_SIZES = [50, 100, 500, 1000]
+
+
+def paginated_table(df, key, version, columns=None, sort_options=None,
+                    search_columns=('student_id', 'name'), formatters=None):
+    """Show one page of ``df``; searching, sorting and slicing happen on the server
+
+    ``sort_options`` maps a label to ``(columns, ascending)``; the first entry is
+    the default. Only the visible rows are formatted and sent to the browser.
+    Returns the ordered row positions and a version tuple for the current view.
+    """
+    cache = get_result_cache()
+    col1, col2, col3 = st.columns([3, 2, 1])
+    with col1:
+        search = st.text_input("🔍 검색 (학번/이름)", key=f"{key}_search").strip()
+    with col2:
+        sort_label = None
+        if sort_options:
+            sort_label = st.selectbox("정렬 기준", list(sort_options), key=f"{key}_sort")
+    with col3:
+        page_size = st.selectbox("페이지 크기", PAGE_SIZES, key=f"{key}_page_size")
+    
+    sort_columns, ascending = sort_options[sort_label] if sort_label else (None, True)
+    view_version = (version, search, sort_label)
+    order = cache.get_or_compute(
+        make_key('table_order', *view_version),
+        lambda: order_positions(df, sort_columns, ascending,
+                                search_positions(df, search_columns, search))
+    )
+    
+    total = len(order)
+    n_pages = max(1, -(-total // page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = 1
+    page = st.number_input(f"페이지 (총 {n_pages:,}쪽)", min_value=1, max_value=n_pages, step=1, key=page_key)
+    
+    start = (page - 1) * page_size
+    window = df.take(order[start:start + page_size])
+    if columns is not None:
+        window = window[columns]
+    for col, fmt in (formatters or {}).items():
+        window = window.assign(**{col: window[col].map(fmt)})
+    st.dataframe(window, use_container_width=True)
+    if total:
+        st.caption(f"총 {total:,}건 중 {start + 1:,}–{start + len(window):,}번째 표시")
+    else:
+        st.caption("표시할 데이터가 없습니다.")
+    return order, view_version
+
+
+def render_memory_panel(cache):
+    """Sidebar table of this session's memory use and the shared cache's totals"""
+    st.sidebar.markdown("### 🧠 메모리 패널")
+    table = session_memory(st.session_state, (cache, get_shared_frames()))
+    st.sidebar.caption(
+        f"세션 전용 {owned_bytes(table) / 1024 ** 2:,.1f} MB / 한도 {SESSION_MEMORY_BYTES / 1024 ** 2:,.0f} MB"
+        f" · 공유 참조 {table.loc[table['공유'], '크기(MB)'].sum():,.1f} MB"
+        f" · 디스크 {table['디스크(MB)'].sum():,.1f} MB"
+    )
+    st.sidebar.dataframe(table.round(2), hide_index=True)
+    
+    stats = cache.stats()
+    st.sidebar.caption(
+        f"공유 캐시 {stats['memory_bytes'] / 1024 ** 2:,.1f} MB / 한도 {stats['max_bytes'] / 1024 ** 2:,.0f} MB"
+        f" ({stats['entries']}개) · 디스크 {stats['spilled_bytes'] / 1024 ** 2:,.1f} MB"
+        f" ({stats['spilled_entries']}개) · 적중 {stats['hits']}회, 디스크 적중 {stats['spill_hits']}회,"
+        f" 미적중 {stats['misses']}회"
+    )
+
+
+def render_performance_panel(tracer):
+    """Sidebar table of stage timings for the last few reruns, with JSON export"""
+    st.sidebar.markdown("### ⏱ 성능 패널")
+    last_n = st.sidebar.number_input("표시할 실행 수", min_value=1, max_value=50, value=10, key='performance_last_n')
+    runs = tracer.completed_runs(last_n)
+    
+    rows = []
+    for run in reversed(runs):
+        row = {'실행': run['run'], '화면': run['label'], '전체(초)': round(run['seconds'], 3)}
+        for stage in run['stages']:
+            column = f"{stage['stage']}(초)"
+            row[column] = round(row.get(column, 0) + stage['seconds'], 3)
+        rows.append(row)
+    st.sidebar.dataframe(pd.DataFrame(rows), hide_index=True)
+    
+    latest = next((run for run in reversed(runs) if run['stages']), None)
+    if latest is not None:
+        st.sidebar.caption(f"실행 {latest['run']}의 단계별 상세")
+        detail = pd.DataFrame(latest['stages'])
+        detail['rss_delta_MB'] = detail['rss_delta_bytes'] / 1024 ** 2
+        st.sidebar.dataframe(
+            detail[['stage', 'seconds', 'rows', 'rss_delta_MB']].round(3),
+            hide_index=True
+        )
+    
+    # Serialized only on click; the tracer guards its runs with a lock, so the worker thread may read them
+    st.sidebar.download_button(
+        "📥 트레이스 JSON 다운로드",
+        tracer.to_json,
+        f"performance_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        "application/json"
+    )
+
+
+def lazy_download_button(label, build, file_name, mime, version):
+    """Download button whose payload is built only on click, once per result version
+
+    ``build`` returns the file contents; ``version`` identifies the data and
+    filters it was derived from, so reruns reuse the serialized payload.
+    """
+    export_key = make_key('export', label, version)
+    cache = get_result_cache()
+    
+    tracer = st.session_state.tracer
+    
+    def traced_build():
+        with tracer.stage(f"export: {label}") as span:
+            payload = build()
+            span.rows = len(payload)
+        return payload
+    
+    st.download_button(
+        label,
+        lambda: cache.get_or_compute(export_key, traced_build),
+        file_name,
+        mime
+    )
@@ -0,0 +1,48 @@
+import pytest
+
+from scholarship import (
+    DEFAULT_SCHOLARSHIP_AMOUNTS,
+    assign_scholarships,
+    calculate_quotas,
+    compute_rankings,
+    filter_eligible,
+    generate_sample_data,
+    normalize_students
+)
+
+
+@pytest.fixture(scope='module')
+def students():
+    return normalize_students(generate_sample_data(3000, seed=11))
+
+
+@pytest.fixture(scope='module')
+def ranking(students):
+    return compute_rankings(filter_eligible(students))
+
+
+@pytest.mark.parametrize('total_budget', [800000000, 500000000, 50000000, 0])
+def test_spend_stays_within_budget(students, ranking, total_budget):
+    quotas = calculate_quotas(students, total_budget)
+    recipients = assign_scholarships(ranking, quotas, students)
+    
+    assert recipients['scholarship_amount'].sum() <= total_budget
+    awarded = recipients['scholarship_type'].value_counts()
+    for scholarship_type in DEFAULT_SCHOLARSHIP_AMOUNTS:
+        to = sum(data['quotas'][scholarship_type] for data in quotas.values())
+        assert awarded.get(scholarship_type, 0) <= to
+
+
+def test_zero_to_awards_nobody(students, ranking):
+    quotas = calculate_quotas(students, 0)
+    assert assign_scholarships(ranking, quotas, students).empty
+
+
+def test_amounts_follow_the_to(students, ranking):
+    amounts = {'율곡장학': 4000000, '다산장학': 2500000, '원천장학': 1000000}
+    quotas = calculate_quotas(students, 500000000, amounts)
+    recipients = assign_scholarships(ranking, quotas, students)
+    
+    paid = dict(zip(recipients['scholarship_type'], recipients['scholarship_amount']))
+    assert paid == amounts
+    assert recipients['scholarship_amount'].sum() <= 500000000
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scholarship import (
+    apply_student_updates,
+    compute_rankings,
+    filter_eligible,
+    generate_sample_data,
+    join_students,
+    normalize_students,
+    rerank_students
+)
+
+
+@pytest.fixture(scope='module')
+def students():
+    # Coarse GPAs and credits, so that many students tie on every ranking key
+    students = generate_sample_data(3000, seed=7)
+    students['prev_semester_gpa'] = students['prev_semester_gpa'].round(1)
+    students['prev_semester_credits'] = students['prev_semester_credits'].clip(15, 18)
+    students['prev_semester_major_credits'] = students['prev_semester_major_credits'].clip(9, 10)
+    return normalize_students(students)
+
+
+def ranked(ranking, students):
+    return join_students(ranking, students, ['student_id'])[['student_id', 'rank']]
+
+
+def full_rerank(students):
+    return compute_rankings(filter_eligible(students))
+
+
+def correction(students, rng):
+    """A random single-record update: GPA, credits or academic status"""
+    student = students.iloc[rng.integers(len(students))]
+    column = rng.choice(['prev_semester_gpa', 'prev_semester_credits', 'academic_status'])
+    if column == 'prev_semester_gpa':
+        value = round(float(rng.uniform(1.5, 4.5)), 1)
+    elif column == 'prev_semester_credits':
+        value = int(rng.integers(15, 19))
+    else:
+        value = rng.choice(['재학', '휴학'])
+    return pd.DataFrame({'student_id': [student['student_id']], column: [value]})
+
+
+def test_rerank_matches_full_rerank(students):
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        corrected = students.copy()
+        ranking = full_rerank(corrected)
+        updates = correction(corrected, rng)
+        apply_student_updates(corrected, updates)
+        
+        ranking, _ = rerank_students(ranking, corrected, updates['student_id'])
+        pd.testing.assert_frame_equal(
+            ranked(ranking, corrected), ranked(full_rerank(corrected), corrected)
+        )
+
+
+def test_noop_update_moves_nobody(students):
+    corrected = students.copy()
+    ranking = full_rerank(corrected)
+    expected = ranked(ranking, corrected)
+    for student_id in corrected['student_id'][corrected['academic_status'] == '재학'].head(50):
+        updates = pd.DataFrame({'student_id': [student_id], 'academic_status': ['재학']})
+        apply_student_updates(corrected, updates)
+        ranking, moved = rerank_students(ranking, corrected, updates['student_id'])
+        assert moved.empty
+        pd.testing.assert_frame_equal(ranked(ranking, corrected), expected)
+
+
+def test_typed_in_id_matches_integer_ids(students):
+    # Parquet, Feather and the non-streaming CSV reader parse IDs as integers
+    raw = students.assign(student_id=students['student_id'].astype('int64'))
+    corrected = normalize_students(raw)
+    ranking = full_rerank(corrected)
+    student_id = str(raw['student_id'].iloc[0])
+    
+    assert (corrected['student_id'] == student_id).sum() == 1
+    updates = pd.DataFrame({'student_id': [student_id], 'prev_semester_gpa': [4.5]})
+    apply_student_updates(corrected, updates)
+    ranking, _ = rerank_students(ranking, corrected, updates['student_id'])
+    pd.testing.assert_frame_equal(ranked(ranking, corrected), ranked(full_rerank(corrected), corrected))
@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+from scholarship import generate_sample_data, normalize_students, run_scenarios, scenario_grid
+
+
+@pytest.fixture(scope='module')
+def students():
+    return normalize_students(generate_sample_data(3000, seed=5))
+
+
+def test_scenarios_follow_the_to(students):
+    scenarios = scenario_grid([800000000, 500000000, 50000000, 0], min_gpas=(2.0, 3.0))
+    comparison = run_scenarios(students, scenarios, max_workers=1)
+    
+    assert (comparison['집행예산'] <= comparison['총예산']).all()
+    assert (comparison['선정인원'] <= comparison['TO']).all()
+    assert comparison.loc[comparison['총예산'] == 0, '선정인원'].eq(0).all()
+    
+    parallel = run_scenarios(students, scenarios, max_workers=2)
+    pd.testing.assert_frame_equal(parallel, comparison)
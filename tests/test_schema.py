@@ -0,0 +1,51 @@
+import io
+
+import pandas as pd
+
+from scholarship import (
+    compute_rankings,
+    filter_eligible,
+    generate_sample_data,
+    join_students,
+    normalize_students,
+    read_students_csv
+)
+
+
+def csv_source(lines):
+    return io.BytesIO(('\n'.join(lines) + '\n').encode('utf-8'))
+
+
+def test_rows_with_wrong_field_count_are_rejected():
+    students = generate_sample_data(20, seed=1)
+    lines = students.to_csv(index=False).splitlines()
+    extra = lines[3].split(',')
+    extra.insert(9, '3.9')
+    lines[3] = ','.join(extra)
+    missing = lines[5].split(',')
+    del missing[4]
+    lines[5] = ','.join(missing)
+    lines.insert(8, '')
+    
+    accepted, errors, rejected_count = read_students_csv(csv_source(lines), chunksize=7)
+    
+    assert rejected_count == 2
+    assert errors['데이터 행'].tolist() == [3, 5]
+    assert (errors['오류 사유'] == "필드 수 오류").all()
+    assert len(accepted) == 18
+    assert pd.api.types.is_integer_dtype(accepted['total_credits'])
+    bad_ids = {extra[0], missing[0]}
+    assert not accepted['student_id'].astype(str).isin(bad_ids).any()
+
+
+
+def test_normalize_gives_unique_row_labels():
+    students = generate_sample_data(200, seed=3)
+    # Two uploads concatenated without ignore_index repeat every label
+    doubled = pd.concat([students, students.assign(student_id=students['student_id'] + 'x')])
+    
+    normalized = normalize_students(doubled)
+    assert normalized.index.equals(pd.RangeIndex(len(doubled)))
+    ranking = compute_rankings(filter_eligible(normalized))
+    joined = join_students(ranking, normalized, ['student_id'])
+    assert joined['student_id'].is_unique
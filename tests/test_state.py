@@ -0,0 +1,41 @@
+import pandas as pd
+import streamlit as st
+
+from scholarship import (
+    SQLiteStore,
+    assign_scholarships,
+    calculate_quotas,
+    compute_rankings,
+    filter_eligible,
+    generate_sample_data,
+    normalize_students
+)
+from scholarship_app.state import NO_OVERRIDES, init_session, load_from_store
+
+
+def test_store_assignment_drops_stale_overrides(tmp_path):
+    students = normalize_students(generate_sample_data(500, seed=2))
+    ranking = compute_rankings(filter_eligible(students))
+    assignments = assign_scholarships(ranking, calculate_quotas(students, 300000000), students)
+    
+    for key in list(st.session_state):
+        del st.session_state[key]
+    init_session()
+    state = st.session_state
+    # A manual change this session made to its own, older assignment
+    state.assignment_base = assignments
+    state.assignment_base_key = 'assignment-old'
+    state.assignment_key = 'assignment-old-adjusted'
+    state.assignment_overrides = pd.DataFrame({
+        'row': assignments['row'].iloc[:1].to_numpy(), 'scholarship_type': [None]
+    })
+    
+    # Another session saves a different assignment
+    store = SQLiteStore(str(tmp_path / 'scholarship.db'))
+    store.save_assignments(assignments.iloc[1:], 'assignment-other')
+    load_from_store(store)
+    
+    assert state.assignment_key == 'assignment-other'
+    assert state.assignment_base_key == 'assignment-other'
+    assert state.assignment_overrides is NO_OVERRIDES
+    assert len(state.assignment_base) == len(assignments) - 1